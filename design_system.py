@@ -4,12 +4,69 @@ import tkinter as tk
 from tkinter import ttk, font
 import os
 
+# Number of leading characters shown in a typing feedback strip
+FEEDBACK_CHARS = 50
+
+# Delay for coalescing key releases into one feedback redraw (about one frame)
+FEEDBACK_DELAY_MS = 16
+
+
+class FeedbackStrip:
+    """Row of canvas cells marking each typed character as matching the expected text or not"""
+    
+    def __init__(self, canvas, match_color="green", miss_color="red"):
+        self.canvas = canvas
+        self.match_color = match_color
+        self.miss_color = miss_color
+        
+        # One cell per character, created once and recolored as the user types
+        self._cells = [
+            canvas.create_rectangle(i * 10, 0, (i + 1) * 10, 20,
+                                    outline="", state=tk.HIDDEN)
+            for i in range(FEEDBACK_CHARS)
+        ]
+        self._shown = 0
+        # Color each cell is showing, None while hidden
+        self._colors = [None] * FEEDBACK_CHARS
+    
+    def update(self, typed, expected):
+        """Recolor the strip for the typed text against the expected text"""
+        # Recolor only the cells whose color changed and hide any left over
+        # from a longer input
+        canvas = self.canvas
+        cells = self._cells
+        colors = self._colors
+        match_color = self.match_color
+        miss_color = self.miss_color
+        shown = min(len(typed), len(expected), FEEDBACK_CHARS)
+        for i in range(shown):
+            color = match_color if typed[i] == expected[i] else miss_color
+            if colors[i] != color:
+                canvas.itemconfigure(cells[i], fill=color, state=tk.NORMAL)
+                colors[i] = color
+        for i in range(shown, self._shown):
+            canvas.itemconfigure(cells[i], state=tk.HIDDEN)
+            colors[i] = None
+        self._shown = shown
+    
+    def clear(self):
+        """Hide every cell"""
+        self.update("", "")
+
+
 class TypingStudyDesignSystem:
     """
     Implements the UX/UI design system for the typing study application.
     """
     
     def __init__(self, root, theme="light"):
+        # Fonts and ttk styles are registered once per root window; another
+        # design system for the same root and theme shares that setup
+        existing = getattr(root, "_design_system", None)
+        if existing is not None and existing.theme == theme:
+            self.__dict__.update(existing.__dict__)
+            return
+        
         self.root = root
         self.theme = theme
         
@@ -20,8 +77,12 @@ class TypingStudyDesignSystem:
         # Initialize design tokens
         self._init_tokens()
         
+        # Feedback strip drawn on each feedback canvas, created on first use
+        self._feedback_strips = {}
+        
         # Apply base styling
         self._apply_base_styling()
+        root._design_system = self
     
     def _init_tokens(self):
         """Initialize design tokens based on design guide"""
@@ -334,58 +395,21 @@ class TypingStudyDesignSystem:
         
         return canvas
     
-    def update_feedback_canvas(self, canvas, typed, expected, max_chars=50):
+    def _feedback_strip(self, canvas):
+        """Return the feedback strip drawn on a canvas, creating it on first use"""
+        strip = self._feedback_strips.get(canvas)
+        if strip is None:
+            strip = FeedbackStrip(canvas, match_color="#4CAF50", miss_color="#F44336")
+            self._feedback_strips[canvas] = strip
+        return strip
+    
+    def update_feedback_canvas(self, canvas, typed, expected):
         """Update feedback canvas with typing match visualization"""
-        # Clear canvas
-        canvas.delete("all")
-        
-        # Calculate char width based on canvas size
-        canvas_width = canvas.winfo_width()
-        if canvas_width <= 1:  # Not yet rendered
-            canvas_width = 500  # Default
-        
-        char_width = min(20, canvas_width / max_chars)
-        
-        # Draw feedback
-        for i, (typed_char, expected_char) in enumerate(zip(typed, expected)):
-            if i >= max_chars:  # Only show limited characters
-                break
-                
-            # Determine color based on match
-            if typed_char == expected_char:
-                color = "#4CAF50"  # Green
-            else:
-                color = "#F44336"  # Red
-            
-            # Draw rectangle
-            canvas.create_rectangle(
-                i * char_width, 0, 
-                (i + 1) * char_width, 20, 
-                fill=color, 
-                outline=""
-            )
-        
-        # Show remaining characters as empty
-        for i in range(len(typed), min(len(expected), max_chars)):
-            canvas.create_rectangle(
-                i * char_width, 0, 
-                (i + 1) * char_width, 20, 
-                fill=self.colors["surface"], 
-                outline="#CCCCCC"
-            )
-        
-        # Calculate accuracy percentage
-        if expected:
-            matches = sum(1 for a, b in zip(typed, expected) if a == b)
-            accuracy = matches / min(len(typed), len(expected)) if len(typed) > 0 else 0
-            
-            # Draw accuracy indicator
-            canvas.create_text(
-                canvas_width - 50, 10,
-                text=f"{accuracy*100:.0f}%",
-                fill=self.colors["text_primary"],
-                font=(self.fonts["secondary"][0], 10)
-            )
+        self._feedback_strip(canvas).update(typed, expected)
+    
+    def clear_feedback_canvas(self, canvas):
+        """Clear the typing match visualization from a feedback canvas"""
+        self._feedback_strip(canvas).clear()
     
     def create_sparkline(self, parent, data=None, width=200, height=30):
         """Create a sparkline visualization for typing speed trends"""
@@ -435,16 +459,14 @@ class TypingStudyDesignSystem:
             y = height - ((val - min_val) / range_val * height * 0.8 + height * 0.1)
             points.append((x, y))
         
-        # Draw line
+        # Draw line as a single polyline item through all points
         if len(points) > 1:
-            for i in range(len(points) - 1):
-                canvas.create_line(
-                    points[i][0], points[i][1],
-                    points[i+1][0], points[i+1][1],
-                    fill=self.colors["primary"],
-                    width=2,
-                    smooth=True
-                )
+            canvas.create_line(
+                *[coord for point in points for coord in point],
+                fill=self.colors["primary"],
+                width=2,
+                smooth=True
+            )
         
         # Draw dots
         for x, y in points:
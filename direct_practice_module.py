@@ -4,15 +4,16 @@ import os
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 import threading
+import queue
 from datetime import datetime
 import time
 from typing import List, Dict, Any, Optional, Callable
 
 from parser.study_item import StudyItem, StudyItemCollection, StudyItemType
-from parser.content_parser import PDFStudyExtractor
 from parser.text_parser import TextParser
 from integration.sequential_practice import SequentialPractice
 from integration.challenge_generator import TypingChallenge
+from design_system import FeedbackStrip, FEEDBACK_CHARS, FEEDBACK_DELAY_MS
 
 
 class DirectPracticeModule:
@@ -28,6 +29,9 @@ class DirectPracticeModule:
         self.timer_running = False
         self.start_time = None
         
+        # Pending after id for the coalesced typing feedback redraw, if any
+        self._feedback_after_id = None
+        
         # Create UI
         self._create_ui()
     
@@ -167,8 +171,10 @@ class DirectPracticeModule:
         self.feedback_canvas = tk.Canvas(typing_frame, height=30)
         self.feedback_canvas.pack(fill=tk.X, padx=10, pady=5)
         
+        self.feedback_strip = FeedbackStrip(self.feedback_canvas)
+        
         # Bind key events for real-time feedback
-        self.typing_text.bind("<KeyRelease>", self._update_typing_feedback)
+        self.typing_text.bind("<KeyRelease>", self._schedule_typing_feedback)
         
         # Item results
         self.item_results_frame = ttk.Frame(self.card_frame)
@@ -259,33 +265,51 @@ class DirectPracticeModule:
         status_var = tk.StringVar(value="Reading PDF...")
         ttk.Label(progress_window, textvariable=status_var).pack(pady=10)
         
-        # Process in a separate thread to avoid freezing the UI
+        # Process in a separate thread to avoid freezing the UI; the worker
+        # only reports through the queue and _poll_pdf_queue applies the
+        # results on the Tk thread
+        status_queue = queue.Queue()
+        
         def process_pdf():
             try:
                 # Extract study items
+                from parser.content_parser import PDFStudyExtractor
                 extractor = PDFStudyExtractor(file_path)
                 extractor.process()
-                study_items = extractor.get_study_items()
-                
-                # Set up practice session
-                self._setup_practice_session(study_items)
-                
-                # Update status
-                status_var.set(f"Extracted {len(study_items)} practice items")
-                
-                # Close progress window after a delay
-                self.parent.after(1000, progress_window.destroy)
-                
-                # Start practice session
-                self.parent.after(1200, self._start_practice_session)
-                
+                status_queue.put(("done", extractor.get_study_items()))
             except Exception as e:
-                status_var.set(f"Error: {str(e)}")
-                self.parent.after(2000, progress_window.destroy)
-                messagebox.showerror("Error", f"Failed to process PDF: {str(e)}")
+                status_queue.put(("error", e))
         
         # Start processing thread
-        threading.Thread(target=process_pdf).start()
+        threading.Thread(target=process_pdf, daemon=True).start()
+        self.parent.after(100, self._poll_pdf_queue, status_queue, status_var, progress_window)
+    
+    def _poll_pdf_queue(self, status_queue, status_var, progress_window):
+        """Apply the PDF extraction result on the Tk thread once the worker finishes"""
+        try:
+            kind, payload = status_queue.get_nowait()
+        except queue.Empty:
+            # Worker still running, check again shortly
+            self.parent.after(100, self._poll_pdf_queue, status_queue, status_var, progress_window)
+            return
+        
+        if kind == "error":
+            status_var.set(f"Error: {str(payload)}")
+            self.parent.after(2000, progress_window.destroy)
+            messagebox.showerror("Error", f"Failed to process PDF: {str(payload)}")
+            return
+        
+        # Set up practice session
+        self._setup_practice_session(payload)
+        
+        # Update status
+        status_var.set(f"Extracted {len(payload)} practice items")
+        
+        # Close progress window after a delay
+        self.parent.after(1000, progress_window.destroy)
+        
+        # Start practice session
+        self.parent.after(1200, self._start_practice_session)
     
     def _upload_text(self):
         """Upload and process a text file"""
@@ -346,14 +370,14 @@ class DirectPracticeModule:
         # Initialize the practice session
         self.practice = SequentialPractice(study_items)
         
-        # Make study items available to the master app if needed
+        # Make study items available to the master app if needed. The app gets
+        # its own list, so its later imports don't shift the session's items,
+        # and its collection views that list like the app's own
         if hasattr(self.master_app, 'study_items'):
-            self.master_app.study_items = study_items
-        
-        if hasattr(self.master_app, 'study_collection'):
-            collection = StudyItemCollection()
-            collection.add_items(study_items)
-            self.master_app.study_collection = collection
+            self.master_app.study_items = list(study_items)
+            
+            if hasattr(self.master_app, 'study_collection'):
+                self.master_app.study_collection = StudyItemCollection(self.master_app.study_items)
         
         # Update learning tracker if it exists
         if hasattr(self.master_app, 'learning_tracker'):
@@ -412,6 +436,7 @@ class DirectPracticeModule:
         
         # Create a challenge for this item
         self.current_challenge = self.practice.get_challenge_for_current_item()
+        self._expected_prefix = item.answer[:FEEDBACK_CHARS]
         
         # Update UI
         self.context_var.set(f"Context: {item.context} • Type: {item.item_type.value}")
@@ -440,6 +465,16 @@ class DirectPracticeModule:
         # Focus on typing area
         self.typing_text.focus_set()
     
+    def _schedule_typing_feedback(self, event=None):
+        """Coalesce key releases into at most one feedback redraw per frame"""
+        if self._feedback_after_id is None:
+            self._feedback_after_id = self.parent.after(FEEDBACK_DELAY_MS, self._do_typing_feedback)
+    
+    def _do_typing_feedback(self):
+        """Run a pending typing feedback redraw"""
+        self._feedback_after_id = None
+        self._update_typing_feedback(None)
+    
     def _update_typing_feedback(self, event):
         """Update real-time feedback for typing"""
         if not self.current_challenge:
@@ -447,24 +482,9 @@ class DirectPracticeModule:
         
         # Get typed text and expected text
         typed = self.typing_text.get("1.0", tk.END).strip()
-        expected = self.current_challenge.study_item.answer
+        expected = self._expected_prefix
         
-        # Clear canvas
-        self.feedback_canvas.delete("all")
-        
-        # Draw feedback
-        for i, (typed_char, expected_char) in enumerate(zip(typed, expected)):
-            if i >= 50:  # Only show first 50 characters
-                break
-                
-            if typed_char == expected_char:
-                color = "green"
-            else:
-                color = "red"
-            
-            self.feedback_canvas.create_rectangle(
-                i * 10, 0, (i + 1) * 10, 20, fill=color, outline=""
-            )
+        self.feedback_strip.update(typed, expected)
     
     def _submit_answer(self):
         """Submit the current answer"""
@@ -524,6 +544,7 @@ class DirectPracticeModule:
             
             # Create a challenge for this item
             self.current_challenge = self.practice.get_challenge_for_current_item()
+            self._expected_prefix = item.answer[:FEEDBACK_CHARS]
             
             # Update UI
             self.context_var.set(f"Context: {item.context} • Type: {item.item_type.value}")
@@ -575,8 +596,8 @@ class DirectPracticeModule:
                 self.master_app.learning_tracker.record_challenge_result(result)
             
             # Update statistics
-            if hasattr(self.master_app, '_update_statistics'):
-                self.master_app._update_statistics()
+            if hasattr(self.master_app, '_schedule_stats_refresh'):
+                self.master_app._schedule_stats_refresh()
         
         # Show summary
         messagebox.showinfo("Session Summary", 
@@ -588,8 +609,8 @@ class DirectPracticeModule:
                          f"Duration: {summary['duration_minutes']:.1f} minutes")
         
         # Add to session history if possible
-        if hasattr(self.master_app, 'sessions_table'):
-            self.master_app.sessions_table.insert("", 0, values=(
+        if hasattr(self.master_app, '_add_session_row'):
+            self.master_app._add_session_row((
                 summary["date"],
                 f"{summary['duration_minutes']:.1f} min",
                 summary["items_completed"],
@@ -1,5 +1,6 @@
 # integration/challenge_generator.py
 
+import operator
 import random
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -62,7 +63,12 @@ class TypingChallenge:
         if not expected:
             return 1.0  # Empty expected answer
         
-        matches = sum(1 for a, b in zip(user_input, expected) if a == b)
+        # Exact match needs no per-character pass
+        if user_input == expected:
+            return 1.0
+        
+        # map() with operator.eq keeps the comparison loop in C
+        matches = sum(map(operator.eq, user_input, expected))
         return matches / len(expected)
 
 
@@ -2,12 +2,36 @@
 
 import os
 import json
+import mmap
+import pickle
 from datetime import datetime, timedelta
 import math
 import random
 from typing import List, Dict, Any, Optional, Tuple
 
-from parser.study_item import StudyItem, StudyItemCollection
+from parser.study_item import StudyItem, StudyItemCollection, json_dumps, json_loads, SIDECAR_LOAD_ERRORS
+
+
+def _read_progress_file(filepath: str, st: os.stat_result) -> Dict[str, Any]:
+    """Read and parse a progress file"""
+    with open(filepath, "rb") as f:
+        if st.st_size:
+            # Parse straight from the page cache instead of reading a bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return json_loads(view)
+        return json_loads(b"")
+
+
+
+def _fresh_session_stats(start_time: Optional[datetime] = None) -> Dict[str, Any]:
+    """Return empty session statistics for a session starting at start_time"""
+    return {
+        "start_time": start_time,
+        "items_studied": 0,
+        "correct_items": 0,
+        "total_accuracy": 0,
+        "total_wpm": 0
+    }
 
 
 class SpacedRepetitionSystem:
@@ -16,12 +40,21 @@ class SpacedRepetitionSystem:
     def __init__(self, study_items: List[StudyItem] = None):
         self.study_items = study_items or []
         self.session_history: List[Dict[str, Any]] = []
+        # Last get_learning_stats() result, cleared whenever items or mastery change
+        self._stats_cache: Optional[Dict[str, Any]] = None
         self.data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
         os.makedirs(self.data_dir, exist_ok=True)
     
     def add_items(self, items: List[StudyItem]) -> None:
         """Add study items to the system"""
         self.study_items.extend(items)
+        self._stats_cache = None
+    
+    def reset(self, items: List[StudyItem] = None) -> None:
+        """Replace the study items and clear the session history"""
+        self.study_items = list(items) if items else []
+        self.session_history = []
+        self._stats_cache = None
     
     def get_next_item(self) -> Optional[StudyItem]:
         """Get the next study item based on spaced repetition algorithm"""
@@ -81,6 +114,7 @@ class SpacedRepetitionSystem:
                 # Ensure mastery stays between 0 and 1
                 item.mastery = max(0.0, min(1.0, new_mastery))
                 item.last_studied = datetime.now()
+                self._stats_cache = None
                 
                 # Record in session history
                 self.session_history.append({
@@ -120,18 +154,41 @@ class SpacedRepetitionSystem:
         }
         
         filepath = os.path.join(self.data_dir, f"{filename}.json")
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(json_dumps(data))
+        self._write_progress_cache(filepath)
         
         return filepath
     
+    def _write_progress_cache(self, filepath: str) -> None:
+        """Write the pickle sidecar load_progress prefers over the JSON file"""
+        with open(filepath + ".pkl", "wb") as f:
+            pickle.dump((self.study_items, self.session_history), f, protocol=5)
+    
     def load_progress(self, filename: str = "study_progress") -> bool:
         """Load study progress from a file"""
         filepath = os.path.join(self.data_dir, f"{filename}.json")
         
+        # One stat serves the sidecar check and the JSON read
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
+            st = os.stat(filepath)
+        except FileNotFoundError:
+            # No progress has been saved yet
+            return False
+        
+        # Use the pickle sidecar only if it is at least as new as the JSON file
+        cache_path = filepath + ".pkl"
+        try:
+            if os.stat(cache_path).st_mtime_ns >= st.st_mtime_ns:
+                with open(cache_path, "rb") as f:
+                    self.study_items, self.session_history = pickle.load(f)
+                self._stats_cache = None
+                return True
+        except SIDECAR_LOAD_ERRORS:
+            pass
+        
+        try:
+            data = _read_progress_file(filepath, st)
             
             # Load study items
             self.study_items = []
@@ -141,10 +198,21 @@ class SpacedRepetitionSystem:
             
             # Load session history
             self.session_history = data.get("session_history", [])
+            self._stats_cache = None
+            
+            # Next startup can skip the JSON parse
+            try:
+                self._write_progress_cache(filepath)
+            except OSError as e:
+                print(f"Error caching progress: {str(e)}")
             
             return True
         
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+        except FileNotFoundError:
+            # No progress has been saved yet
+            return False
+        
+        except json.JSONDecodeError as e:
             print(f"Error loading progress: {str(e)}")
             return False
     
@@ -180,23 +248,37 @@ class SpacedRepetitionSystem:
     
     def get_learning_stats(self) -> Dict[str, Any]:
         """Get learning statistics"""
+        # Callers may add keys to the result, so hand out a copy of the cache
+        if self._stats_cache is not None:
+            return dict(self._stats_cache)
+        
         if not self.study_items:
-            return {
+            stats = {
                 "total_items": 0,
                 "mastered_items": 0,
                 "mastery_percentage": 0,
                 "average_mastery": 0
             }
+        else:
+            # Count mastered items and total mastery in one pass
+            mastered_items = 0
+            total_mastery = 0.0
+            for item in self.study_items:
+                mastery = item.mastery
+                total_mastery += mastery
+                if mastery >= 0.8:
+                    mastered_items += 1
+            average_mastery = total_mastery / len(self.study_items)
+            
+            stats = {
+                "total_items": len(self.study_items),
+                "mastered_items": mastered_items,
+                "mastery_percentage": (mastered_items / len(self.study_items)) * 100,
+                "average_mastery": average_mastery
+            }
         
-        mastered_items = sum(1 for item in self.study_items if item.mastery >= 0.8)
-        average_mastery = sum(item.mastery for item in self.study_items) / len(self.study_items)
-        
-        return {
-            "total_items": len(self.study_items),
-            "mastered_items": mastered_items,
-            "mastery_percentage": (mastered_items / len(self.study_items)) * 100,
-            "average_mastery": average_mastery
-        }
+        self._stats_cache = stats
+        return dict(stats)
 
 
 class LearningTracker:
@@ -204,23 +286,11 @@ class LearningTracker:
     
     def __init__(self):
         self.spaced_repetition = SpacedRepetitionSystem()
-        self.session_stats: Dict[str, Any] = {
-            "start_time": None,
-            "items_studied": 0,
-            "correct_items": 0,
-            "total_accuracy": 0,
-            "total_wpm": 0
-        }
+        self.session_stats: Dict[str, Any] = _fresh_session_stats()
     
     def start_session(self) -> None:
         """Start a new study session"""
-        self.session_stats = {
-            "start_time": datetime.now(),
-            "items_studied": 0,
-            "correct_items": 0,
-            "total_accuracy": 0,
-            "total_wpm": 0
-        }
+        self.session_stats = _fresh_session_stats(datetime.now())
     
     def record_challenge_result(self, results: Dict[str, Any]) -> None:
         """Record the results of a typing challenge"""
@@ -258,13 +328,7 @@ class LearningTracker:
         }
         
         # Reset session stats
-        self.session_stats = {
-            "start_time": None,
-            "items_studied": 0,
-            "correct_items": 0,
-            "total_accuracy": 0,
-            "total_wpm": 0
-        }
+        self.session_stats = _fresh_session_stats()
         
         return session_summary
     
@@ -272,6 +336,11 @@ class LearningTracker:
         """Load study items into the tracker"""
         self.spaced_repetition.add_items(items)
     
+    def reset(self, items: List[StudyItem] = None) -> None:
+        """Reset the tracker in place with a new set of study items"""
+        self.spaced_repetition.reset(items)
+        self.session_stats = _fresh_session_stats()
+    
     def get_next_item(self) -> Optional[StudyItem]:
         """Get the next study item based on spaced repetition"""
         return self.spaced_repetition.get_next_item()
@@ -284,6 +353,21 @@ class LearningTracker:
         """Load learning progress from a file"""
         return self.spaced_repetition.load_progress(filename)
     
+    @staticmethod
+    def read_progress(filename: str = "learning_progress") -> Optional[SpacedRepetitionSystem]:
+        """Load learning progress into a new spaced repetition system, or None if there is none
+        
+        Touches no tracker state, so it can run on a worker thread.
+        """
+        system = SpacedRepetitionSystem()
+        return system if system.load_progress(filename) else None
+    
+    def adopt_progress(self, system: SpacedRepetitionSystem) -> None:
+        """Switch to progress from read_progress, keeping items and sessions added meanwhile"""
+        system.add_items(self.spaced_repetition.study_items)
+        system.session_history.extend(self.spaced_repetition.session_history)
+        self.spaced_repetition = system
+    
     def get_learning_stats(self) -> Dict[str, Any]:
         """Get learning statistics"""
         return self.spaced_repetition.get_learning_stats()
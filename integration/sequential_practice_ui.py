@@ -9,6 +9,7 @@ import os
 
 from parser.study_item import StudyItem, StudyItemCollection
 from integration.sequential_practice import SequentialPractice
+from design_system import FeedbackStrip
 
 
 class SequentialPracticeUI:
@@ -132,6 +133,7 @@ class SequentialPracticeUI:
         # Real-time feedback (character matching)
         self.feedback_canvas = tk.Canvas(typing_frame, height=30)
         self.feedback_canvas.pack(fill=tk.X, padx=10, pady=5)
+        self.feedback_strip = FeedbackStrip(self.feedback_canvas)
         
         # Bind key events for real-time feedback
         self.typing_text.bind("<KeyRelease>", self._update_typing_feedback)
@@ -307,22 +309,7 @@ class SequentialPracticeUI:
         typed = self.typing_text.get("1.0", tk.END).strip()
         expected = self.current_challenge.study_item.answer
         
-        # Clear canvas
-        self.feedback_canvas.delete("all")
-        
-        # Draw feedback
-        for i, (typed_char, expected_char) in enumerate(zip(typed, expected)):
-            if i >= 50:  # Only show first 50 characters
-                break
-                
-            if typed_char == expected_char:
-                color = "green"
-            else:
-                color = "red"
-            
-            self.feedback_canvas.create_rectangle(
-                i * 10, 0, (i + 1) * 10, 20, fill=color, outline=""
-            )
+        self.feedback_strip.update(typed, expected)
     
     def _submit_answer(self):
         """Submit the current answer"""
@@ -433,8 +420,8 @@ class SequentialPracticeUI:
                 self.master_app.learning_tracker.record_challenge_result(result)
             
             # Update statistics
-            if hasattr(self.master_app, '_update_statistics'):
-                self.master_app._update_statistics()
+            if hasattr(self.master_app, '_schedule_stats_refresh'):
+                self.master_app._schedule_stats_refresh()
         
         # Show summary
         messagebox.showinfo("Session Summary", 
@@ -450,8 +437,8 @@ class SequentialPracticeUI:
         self.results_frame.pack_forget()
         
         # Add to session history if possible
-        if hasattr(self.master_app, 'sessions_table'):
-            self.master_app.sessions_table.insert("", 0, values=(
+        if hasattr(self.master_app, '_add_session_row'):
+            self.master_app._add_session_row((
                 summary["date"],
                 f"{summary['duration_minutes']:.1f} min",
                 summary["items_completed"],
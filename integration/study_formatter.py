@@ -1,10 +1,9 @@
 # integration/study_formatter.py
 
 from typing import List, Dict, Any
-import json
 import os
 
-from parser.study_item import StudyItem, StudyItemCollection
+from parser.study_item import StudyItem, StudyItemCollection, json_dumps
 
 
 class StudyFormatter:
@@ -56,8 +55,8 @@ class StudyFormatter:
         
         # Save to file
         filepath = os.path.join(self.output_dir, f"{filename}.json")
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(json_dumps(data))
         
         return filepath
     
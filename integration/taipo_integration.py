@@ -1,11 +1,10 @@
 # integration/taipo_integration.py
 
 import os
-import json
 import subprocess
 from typing import List, Dict, Any, Optional
 
-from parser.study_item import StudyItem
+from parser.study_item import StudyItem, json_dumps
 
 
 class TaipoIntegration:
@@ -80,8 +79,8 @@ class TaipoIntegration:
         filepath = os.path.join(self.study_dir, f"{filename}.json")
         
         # Save to file
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(json_dumps(data))
         
         return filepath
     
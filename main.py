@@ -1,15 +1,14 @@
 import os
+import re
 import sys
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 from datetime import datetime
-import threading
-import time
-import uuid  
-from integration.sequential_practice_ui import SequentialPracticeUI
-from direct_practice_module import DirectPracticeModule
-from design_system import TypingStudyDesignSystem
-from session_manager import StudySessionManager
+import queue
+import socket
+import atexit
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 # Add the current directory to Python's path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
@@ -17,10 +16,11 @@ if current_dir not in sys.path:
 
 # Now import your modules
 try:
+    from direct_practice_module import DirectPracticeModule
+    from design_system import TypingStudyDesignSystem, FeedbackStrip, FEEDBACK_CHARS, FEEDBACK_DELAY_MS
     from parser.text_parser import TextParser
-    from parser.content_parser import PDFStudyExtractor
-    from parser.study_item import StudyItem, StudyItemCollection, StudyItemType
-    from integration.challenge_generator import ChallengeGenerator, TypingChallenge
+    from parser.study_item import StudyItem, StudyItemCollection, StudyItemType, new_item_id, json_dumps
+    from integration.challenge_generator import TypingChallenge
     from integration.learning_tracker import LearningTracker
     from integration.study_formatter import StudyFormatter
 except ImportError as e:
@@ -34,29 +34,131 @@ except ImportError as e:
         print(f"Parser directory contents: {os.listdir(os.path.join(current_dir, 'parser'))}")
     sys.exit(1)
 
+# Number of recent sessions kept in the statistics table; the full history
+# lives in the saved progress file
+MAX_VISIBLE_SESSIONS = 50
+
+# Format for load/extraction times shown in the dashboard
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M'
+
+# Port the web UI server is started on by "Use Web UI"
+WEB_UI_PORT = 5000
+
+# Pages read between progress updates while extracting a PDF
+PDF_PROGRESS_PAGES = 10
+
+# Default widget fonts for the application theme
+BASE_FONT = ('Arial', 10)
+APP_THEME_SETTINGS = {
+    'TLabel': {'configure': {'font': BASE_FONT}},
+    'TButton': {'configure': {'font': BASE_FONT}},
+    'TLabelframe.Label': {'configure': {'font': BASE_FONT + ('bold',)}},
+    # Label variants used by the tabs, so widgets share one font each
+    'Header.TLabel': {'configure': {'font': ('Arial', 16, 'bold')}},
+    'Title.TLabel': {'configure': {'font': ('Arial', 12)}},
+    'Prompt.TLabel': {'configure': {'font': ('Arial', 12, 'bold')}},
+    'Body.TLabel': {'configure': {'font': BASE_FONT}},
+    'Bold.TLabel': {'configure': {'font': BASE_FONT + ('bold',)}},
+    'Context.TLabel': {'configure': {'font': BASE_FONT + ('italic',)}},
+}
+
+# Non-blank quick-add lines, matched lazily
+_INPUT_LINE_RE = re.compile(r'[^\r\n]*\S[^\r\n]*')
+
+# TextParser pass for each bulk text format choice; anything else auto-detects
+_BULK_FORMAT_PARSERS = {
+    "qa": TextParser._parse_qa_format,
+    "definition": TextParser._parse_definition_list,
+    "list": TextParser._parse_bullet_list,
+    "plain": TextParser._parse_simple_lines,
+}
+
+# Example input shown by the "Insert Sample Text" button, one per supported format
+SAMPLE_BULK_TEXT = (
+    "Q: What is the capital of France?\n"
+    "A: Paris\n\n"
+    "Q: What is the largest planet in our solar system?\n"
+    "A: Jupiter\n\n"
+    "Photosynthesis - The process by which plants convert light energy into chemical energy\n\n"
+    "• Item one in a list\n"
+    "• Item two in a list\n"
+    "• Item three in a list\n\n"
+    "Prompt for custom item|Answer to be typed|Study Context"
+)
+
+# Study item type for each item type radio button value
+_ITEM_TYPES = {item_type.value: item_type for item_type in StudyItemType}
+
+# Category bar colors, indexed by position in _CATEGORY_NAMES
+_CATEGORY_NAMES = ("definition", "key_concept", "formula", "list", "fill_in_blank")
+_CATEGORY_COLORS = ("#4287f5", "#42f551", "#f54242", "#f5a742", "#b042f5")  # Blue, Green, Red, Orange, Purple
+_CATEGORY_INDEX = {name: idx for idx, name in enumerate(_CATEGORY_NAMES)}
+_CATEGORY_LABELS = tuple(name.replace("_", " ").title() for name in _CATEGORY_NAMES)
+
+
+def _set_if_changed(var, value):
+    """Set a Tk variable only when its value differs, so unchanged labels are not redrawn"""
+    if var.get() != value:
+        var.set(value)
+
+
+def _replace_text(widget, text, chunk_size=65536):
+    """Replace a Text widget's content, inserting large strings in chunks"""
+    widget.delete("1.0", tk.END)
+    for start in range(0, len(text), chunk_size):
+        widget.insert(tk.END, text[start:start + chunk_size])
+        widget.update_idletasks()
+
+
 class PDFStudyTypingTrainer:
     def __init__(self, root):
         self.root = root
         self.root.title("PDF Study Typing Trainer")
         self.root.geometry("900x700")
-        self.design_system = TypingStudyDesignSystem(self.root)
     
         # Initialize design system
         self.design_system = TypingStudyDesignSystem(self.root)
     
+        # The collection is a view over study_items, not a second copy
         self.study_items = []
-        self.study_collection = StudyItemCollection()
-        self.challenge_generator = ChallengeGenerator()
+        self.study_collection = StudyItemCollection(self.study_items)
         self.learning_tracker = LearningTracker()
         self.study_formatter = StudyFormatter()
         self.current_challenge = None
     
+        # Main notebook; _create_ui currently mounts only the practice view,
+        # so the dashboard and statistics tabs may not exist
+        self.notebook = None
+        
+        # Statistics and study tabs are built on first use
+        self._stats_built = False
+        self._study_built = False
+        
+        # Statistics refresh is coalesced into one redraw per idle tick
+        self._stats_dirty = False
+        self._stats_pending = False
+        self._stats_tab_stale = False
+        
+        # Pending after id for the coalesced typing feedback redraw, if any
+        self._feedback_after_id = None
+    
         # Streak tracking (optional for now)
         self.streak_days = 0
     
         # Data directories
         self.data_dir = os.path.join(current_dir, "data")
         os.makedirs(self.data_dir, exist_ok=True)
+        
+        # Worker threads for file I/O that should not block the UI
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        
+        # Web UI server process, started by "Use Web UI"; one exit handler
+        # stops whichever server is current
+        self.flask_process = None
+        atexit.register(self._stop_web_ui)
+        
+        # Saved study files are listed in the background, ready for the load dialog
+        self._refresh_saved_files()
     
         # Create UI
         self._create_ui()
@@ -93,8 +195,6 @@ class PDFStudyTypingTrainer:
     
     def _create_web_ui(self):
         """Create a web-based UI using embedded browser frame"""
-        import tkinter.messagebox as messagebox
-    
         # Display message that web UI is not yet implemented
         messagebox.showinfo("Web UI", "Web UI is not yet implemented. Using native UI instead.")
     
@@ -103,33 +203,78 @@ class PDFStudyTypingTrainer:
 
     def _launch_web_ui(self):
         """Launch the web-based UI"""
-        from api_server import launch_web_ui
-        import threading
         import subprocess
-        import sys
-        import threading
-        from api_server import run_server
-    
-        # Use subprocess to run the Flask server as a separate process
-        flask_process = subprocess.Popen([
-            sys.executable,
-            'api_server.py'
-        ])
-    
-        # Store the process reference to terminate it when needed
-        self.flask_process = flask_process
-        self.flask_thread = threading.Thread(target=run_server, daemon=True)
-        self.flask_thread.start()
-
-      
-    # You might need a method to stop the process when closing your app
+        
+        # Reuse a server started earlier that is still running
+        if self.flask_process is not None and self.flask_process.poll() is None:
+            webbrowser.open(f"http://localhost:{WEB_UI_PORT}")
+            return
+        
+        # Run the Flask server in one separate process, without the reloader
+        self.flask_process = subprocess.Popen([
+            sys.executable, '-c',
+            f'from api_server import run_server; run_server(port={WEB_UI_PORT}, open_browser=False)'
+        ], cwd=current_dir)
+        
+        # Open the browser once the server is accepting connections
+        self.root.after(100, self._poll_web_ui_ready)
+        
         def cleanup():
-            if hasattr(self, 'flask_process'):
-               self.flask_process.terminate()
-    
-    # Attach cleanup to window close event if using Tkinter
+            self._stop_web_ui()
+            self.root.destroy()
+        
+        # Stop the server when the window is closed
         self.root.protocol("WM_DELETE_WINDOW", cleanup)
     
+    def _poll_web_ui_ready(self, attempts=100):
+        """Open the web UI in the browser once its server is up"""
+        if self.flask_process.poll() is not None:
+            messagebox.showerror("Web UI", "The web UI server stopped before it was ready.")
+            return
+        
+        try:
+            socket.create_connection(("127.0.0.1", WEB_UI_PORT), timeout=0.05).close()
+        except OSError:
+            if attempts > 1:
+                self.root.after(100, self._poll_web_ui_ready, attempts - 1)
+            else:
+                self._stop_web_ui()
+                messagebox.showerror("Web UI", "The web UI server did not start in time.")
+            return
+        
+        webbrowser.open(f"http://localhost:{WEB_UI_PORT}")
+    
+    def _stop_web_ui(self):
+        """Stop the web UI server if one is running"""
+        if self.flask_process is not None and self.flask_process.poll() is None:
+            self.flask_process.terminate()
+    
+    def _ensure_stats_tab(self):
+        """Build the statistics tab if it has not been built yet"""
+        if self._stats_built:
+            return
+        
+        self._setup_stats_tab()
+        self._stats_built = True
+        
+        # Catch up on refreshes skipped while the tab was hidden
+        self.stats_tab.bind("<Map>", self._on_stats_tab_shown)
+        
+        # Fill in statistics gathered before the tab existed
+        self._schedule_stats_refresh()
+    
+    def _on_stats_tab_shown(self, event):
+        """Refresh the statistics tab when it is shown after missing updates"""
+        if event.widget is self.stats_tab and self._stats_tab_stale:
+            self._schedule_stats_refresh()
+    
+    def _ensure_study_tab(self):
+        """Build the study tab if it has not been built yet"""
+        if self._study_built:
+            return
+        
+        self._setup_study_tab()
+        self._study_built = True
     
     def _start_structured_session(self):
         """Start a structured 20-minute study session"""
@@ -138,16 +283,16 @@ class PDFStudyTypingTrainer:
             return
     
         # Switch to structured session tab
-        for i in range(self.notebook.index("end")):
-            if "20-Min Session" in self.notebook.tab(i, "text"):
-                self.notebook.select(i)
-                break
+        self.notebook.select(self.structured_tab)
     
         # Start session
         self.session_manager._start_session()
     
     def _setup_structured_session_tab(self):
         """Set up the structured 20-minute session tab"""
+        # Imported here: the session manager is only needed once this tab is set up
+        from session_manager import StudySessionManager
+        
         # Create session manager in the structured tab
         self.session_manager = StudySessionManager(self.structured_tab, self, self.design_system)
     
@@ -174,6 +319,8 @@ class PDFStudyTypingTrainer:
         """Set up the sequential practice tab"""
         self.sequential_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.sequential_tab, text="Sequential Practice")
+        
+        from integration.sequential_practice_ui import SequentialPracticeUI
         self.sequential_practice_ui = SequentialPracticeUI(self.sequential_tab, self)
     
    
@@ -184,7 +331,7 @@ class PDFStudyTypingTrainer:
         header_frame.pack(fill=tk.X, padx=20, pady=10)
     
         ttk.Label(header_frame, text="PDF Study Typing Trainer", 
-                  font=("Arial", 16, "bold")).pack(side=tk.LEFT)
+                  style="Header.TLabel").pack(side=tk.LEFT)
     
         # Main content
         content_frame = ttk.Frame(self.dashboard_tab)
@@ -263,12 +410,12 @@ class PDFStudyTypingTrainer:
         # Prompt context
         self.context_var = tk.StringVar()
         ttk.Label(prompt_frame, textvariable=self.context_var, 
-                  font=("Arial", 10, "italic")).pack(anchor=tk.W, padx=10, pady=5)
+                  style="Context.TLabel").pack(anchor=tk.W, padx=10, pady=5)
         
         # Prompt text
         self.prompt_var = tk.StringVar()
         ttk.Label(prompt_frame, textvariable=self.prompt_var, 
-                  font=("Arial", 12, "bold"), wraplength=800).pack(padx=10, pady=10)
+                  style="Prompt.TLabel", wraplength=800).pack(padx=10, pady=10)
         
         # Reference text (what to type)
         reference_frame = ttk.LabelFrame(self.study_tab, text="Reference Text (Type This)")
@@ -291,8 +438,10 @@ class PDFStudyTypingTrainer:
         self.feedback_canvas = tk.Canvas(typing_frame, height=30)
         self.feedback_canvas.pack(fill=tk.X, padx=10, pady=5)
         
+        self.feedback_strip = FeedbackStrip(self.feedback_canvas)
+        
         # Bind key events for real-time feedback
-        self.typing_text.bind("<KeyRelease>", self._update_typing_feedback)
+        self.typing_text.bind("<KeyRelease>", self._schedule_typing_feedback)
         
         # Results frame
         self.results_frame = ttk.LabelFrame(self.study_tab, text="Results")
@@ -306,13 +455,13 @@ class PDFStudyTypingTrainer:
         self.wpm_var = tk.StringVar(value="WPM: 0")
         self.time_var = tk.StringVar(value="Time: 0s")
         
-        ttk.Label(results_grid, text="Accuracy:", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
+        ttk.Label(results_grid, text="Accuracy:", style="Bold.TLabel").grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
         ttk.Label(results_grid, textvariable=self.accuracy_var).grid(row=0, column=1, sticky=tk.W, padx=5, pady=2)
         
-        ttk.Label(results_grid, text="Typing Speed:", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
+        ttk.Label(results_grid, text="Typing Speed:", style="Bold.TLabel").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
         ttk.Label(results_grid, textvariable=self.wpm_var).grid(row=1, column=1, sticky=tk.W, padx=5, pady=2)
         
-        ttk.Label(results_grid, text="Time Taken:", font=("Arial", 10, "bold")).grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
+        ttk.Label(results_grid, text="Time Taken:", style="Bold.TLabel").grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
         ttk.Label(results_grid, textvariable=self.time_var).grid(row=2, column=1, sticky=tk.W, padx=5, pady=2)
         
         # Buttons frame
@@ -358,6 +507,23 @@ class PDFStudyTypingTrainer:
         self.category_canvas = tk.Canvas(category_frame, height=200, bg="white")
         self.category_canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        # Fixed pool of (bar, label, percentage) canvas items, one slot per
+        # category, shown and hidden instead of being recreated on redraw
+        self._bar_pool = [
+            (
+                self.category_canvas.create_rectangle(0, 0, 0, 0, outline="black", state=tk.HIDDEN),
+                self.category_canvas.create_text(0, 0, angle=45, anchor=tk.NE, state=tk.HIDDEN),
+                self.category_canvas.create_text(0, 0, anchor=tk.S, state=tk.HIDDEN)
+            )
+            for _ in _CATEGORY_NAMES
+        ]
+        # Category index, mastery and whole percentage currently shown by each
+        # slot, and the (width, height, bar count) the slots were laid out for
+        self._slot_categories = [None] * len(self._bar_pool)
+        self._slot_mastery = [None] * len(self._bar_pool)
+        self._slot_percentages = [None] * len(self._bar_pool)
+        self._chart_layout = None
+        
         # Recent sessions
         sessions_frame = ttk.LabelFrame(self.stats_tab, text="Recent Study Sessions")
         sessions_frame.pack(fill=tk.X, padx=20, pady=10)
@@ -394,32 +560,33 @@ class PDFStudyTypingTrainer:
         
         # Header
         ttk.Label(main_frame, text="Add Custom Study Items", 
-                font=("Arial", 16, "bold")).pack(anchor=tk.W, pady=10)
+                style="Header.TLabel").pack(anchor=tk.W, pady=10)
         
         ttk.Label(main_frame, text="Create your own study items for typing practice.", 
-                font=("Arial", 10)).pack(anchor=tk.W, pady=5)
+                style="Body.TLabel").pack(anchor=tk.W, pady=5)
         
         # Create notebook for sub-tabs
-        input_notebook = ttk.Notebook(main_frame)
-        input_notebook.pack(fill=tk.BOTH, expand=True, pady=10)
+        self.input_notebook = ttk.Notebook(main_frame)
+        self.input_notebook.pack(fill=tk.BOTH, expand=True, pady=10)
         
         # Create sub-tabs
-        single_item_tab = ttk.Frame(input_notebook)
-        bulk_text_tab = ttk.Frame(input_notebook)
-        import_tab = ttk.Frame(input_notebook)
+        single_item_tab = ttk.Frame(self.input_notebook)
+        self.bulk_text_tab = ttk.Frame(self.input_notebook)
+        import_tab = ttk.Frame(self.input_notebook)
         
-        input_notebook.add(single_item_tab, text="Single Item")
-        input_notebook.add(bulk_text_tab, text="Bulk Text")
-        input_notebook.add(import_tab, text="Import")
+        self.input_notebook.add(single_item_tab, text="Single Item")
+        self.input_notebook.add(self.bulk_text_tab, text="Bulk Text")
+        self.input_notebook.add(import_tab, text="Import")
         
         # Setup Single Item tab
         self._setup_single_item_tab(single_item_tab)
         
-        # Setup Bulk Text tab
-        self._setup_bulk_text_tab(bulk_text_tab)
-        
-        # Setup Import tab
-        self._setup_import_tab(import_tab)
+        # Bulk Text and Import tabs are built the first time they are shown
+        self._input_tab_builders = {
+            str(self.bulk_text_tab): self._setup_bulk_text_tab,
+            str(import_tab): self._setup_import_tab,
+        }
+        self.input_notebook.bind("<<NotebookTabChanged>>", self._on_input_tab_changed)
         
         # Status bar at the bottom
         status_frame = ttk.Frame(main_frame)
@@ -428,6 +595,11 @@ class PDFStudyTypingTrainer:
         self.item_count_var = tk.StringVar(value="Current items: 0")
         ttk.Label(status_frame, textvariable=self.item_count_var).pack(side=tk.LEFT)
         
+        # Result of the last add/import, shown without a blocking dialog
+        self.input_status_var = tk.StringVar()
+        ttk.Label(status_frame, textvariable=self.input_status_var).pack(side=tk.LEFT, padx=10)
+        self._input_status_after_id = None
+        
         ttk.Button(status_frame, text="Start Studying", 
                 command=self._start_study).pack(side=tk.RIGHT)
         
@@ -435,6 +607,29 @@ class PDFStudyTypingTrainer:
         ttk.Button(status_frame, text="Save Items", 
                 command=self._save_custom_items).pack(side=tk.RIGHT, padx=5)
     
+    def _show_input_status(self, message):
+        """Show a message in the input status bar and clear it after a few seconds"""
+        self.input_status_var.set(message)
+        
+        if self._input_status_after_id is not None:
+            self.root.after_cancel(self._input_status_after_id)
+        self._input_status_after_id = self.root.after(4000, self._clear_input_status)
+    
+    def _clear_input_status(self):
+        """Clear the input status bar message"""
+        self._input_status_after_id = None
+        self.input_status_var.set("")
+    
+    def _on_input_tab_changed(self, event):
+        """Build an input sub-tab the first time it is selected"""
+        self._ensure_input_tab(self.input_notebook.select())
+    
+    def _ensure_input_tab(self, tab_name):
+        """Build the input sub-tab with the given widget path if it has not been built yet"""
+        builder = self._input_tab_builders.pop(tab_name, None)
+        if builder is not None:
+            builder(self.input_notebook.nametowidget(tab_name))
+    
     def _setup_single_item_tab(self, parent):
         """Setup the single item input tab"""
         # Form for adding individual items
@@ -550,28 +745,19 @@ class PDFStudyTypingTrainer:
         self.bulk_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Sample text button
-        def insert_sample():
-            sample = (
-                "Q: What is the capital of France?\n"
-                "A: Paris\n\n"
-                "Q: What is the largest planet in our solar system?\n"
-                "A: Jupiter\n\n"
-                "Photosynthesis - The process by which plants convert light energy into chemical energy\n\n"
-                "• Item one in a list\n"
-                "• Item two in a list\n"
-                "• Item three in a list\n\n"
-                "Prompt for custom item|Answer to be typed|Study Context"
-            )
-            self.bulk_text.delete("1.0", tk.END)
-            self.bulk_text.insert("1.0", sample)
-        
         ttk.Button(bulk_frame, text="Insert Sample Text", 
-                command=insert_sample).pack(side=tk.LEFT, pady=10)
+                command=self._insert_sample_text).pack(side=tk.LEFT, pady=10)
         
         # Import button
         ttk.Button(bulk_frame, text="Import Items", 
                 command=self._import_bulk_items).pack(side=tk.RIGHT, pady=10)
 
+    def _insert_sample_text(self):
+        """Replace the bulk text area with the sample text"""
+        # The sample is small, so one insert is enough
+        self.bulk_text.delete("1.0", tk.END)
+        self.bulk_text.insert("1.0", SAMPLE_BULK_TEXT)
+
     def _setup_import_tab(self, parent):
         """Setup the import tab"""
         # Main frame
@@ -613,11 +799,23 @@ class PDFStudyTypingTrainer:
         ttk.Button(clipboard_frame, text="Paste from Clipboard", 
                 command=self._import_from_clipboard).pack(padx=10, pady=10)
 
+    def _update_source_labels(self, source_text, date_label):
+        """Show where the study items came from, how many there are, and when they were loaded"""
+        _set_if_changed(self.pdf_name_var, source_text)
+        _set_if_changed(self.items_count_var, f"Study items: {len(self.study_items)}")
+        _set_if_changed(self.extraction_date_var, f"{date_label}: {datetime.now().strftime(TIMESTAMP_FORMAT)}")
+    
+    def _add_study_items(self, items):
+        """Add new items to the study list and every structure built from it in one batch"""
+        # study_collection shares the study_items list, so it sees these too
+        self.study_items.extend(items)
+        self.learning_tracker.load_study_items(items)
+    
     def _add_custom_item(self):
         """Add a custom study item from the form"""
         # Get values from form
         item_type_str = self.item_type_var.get()
-        item_type = getattr(StudyItemType, item_type_str.upper())
+        item_type = _ITEM_TYPES[item_type_str]
         
         context = self.context_entry.get()
         importance = self.importance_var.get()
@@ -631,7 +829,7 @@ class PDFStudyTypingTrainer:
         
         # Create study item
         item = StudyItem(
-            id=str(uuid.uuid4()),
+            id=new_item_id(),
             prompt=prompt,
             answer=answer,
             context=context,
@@ -641,23 +839,8 @@ class PDFStudyTypingTrainer:
             source_document="Manual Input"
         )
         
-        # Add to study items
-        self.study_items.append(item)
-        
-        # Add to collection
-        if not hasattr(self, 'study_collection') or self.study_collection is None:
-            self.study_collection = StudyItemCollection()
-        self.study_collection.add_item(item)
-        
-        # Update learning tracker and challenge generator
-        if not hasattr(self, 'learning_tracker') or self.learning_tracker is None:
-            self.learning_tracker = LearningTracker()
-        self.learning_tracker.load_study_items([item])
-        
-        if not hasattr(self, 'challenge_generator') or self.challenge_generator is None:
-            self.challenge_generator = ChallengeGenerator(self.study_items)
-        else:
-            self.challenge_generator.add_items([item])
+        # Add to study items, collection and tracker
+        self._add_study_items([item])
         
         # Clear form
         self.prompt_text.delete("1.0", tk.END)
@@ -670,10 +853,10 @@ class PDFStudyTypingTrainer:
         self.study_btn.config(state=tk.NORMAL)
         
         # Show success message
-        messagebox.showinfo("Item Added", "Study item added successfully!")
+        self._show_input_status("Study item added successfully!")
         
         # Update statistics
-        self._update_statistics()
+        self._schedule_stats_refresh()
 
     def _import_bulk_items(self):
         """Import multiple items from bulk text input"""
@@ -690,16 +873,7 @@ class PDFStudyTypingTrainer:
         parser = TextParser(bulk_text)
         
         # If format is specified and not auto-detect, call the specific parser
-        if format_preference == "qa":
-            parser._parse_qa_format()
-        elif format_preference == "definition":
-            parser._parse_definition_list()
-        elif format_preference == "list":
-            parser._parse_bullet_list()
-        elif format_preference == "plain":
-            parser._parse_simple_lines()
-        else:  # auto detect
-            parser.parse()
+        _BULK_FORMAT_PARSERS.get(format_preference, TextParser.parse)(parser)
         
         items = parser.get_study_items()
         
@@ -709,23 +883,8 @@ class PDFStudyTypingTrainer:
                             "Try using a different format or add items manually.")
             return
         
-        # Add items to study collection
-        for item in items:
-            self.study_items.append(item)
-            
-            if not hasattr(self, 'study_collection') or self.study_collection is None:
-                self.study_collection = StudyItemCollection()
-            self.study_collection.add_item(item)
-        
-        # Update learning tracker and challenge generator
-        if not hasattr(self, 'learning_tracker') or self.learning_tracker is None:
-            self.learning_tracker = LearningTracker()
-        self.learning_tracker.load_study_items(items)
-        
-        if not hasattr(self, 'challenge_generator') or self.challenge_generator is None:
-            self.challenge_generator = ChallengeGenerator(self.study_items)
-        else:
-            self.challenge_generator.add_items(items)
+        # Add items to the study list, collection and tracker
+        self._add_study_items(items)
         
         # Clear text area
         self.bulk_text.delete("1.0", tk.END)
@@ -738,10 +897,10 @@ class PDFStudyTypingTrainer:
             self.study_btn.config(state=tk.NORMAL)
         
         # Show success message
-        messagebox.showinfo("Items Imported", f"Successfully imported {len(items)} study items!")
+        self._show_input_status(f"Successfully imported {len(items)} study items!")
         
         # Update statistics
-        self._update_statistics()
+        self._schedule_stats_refresh()
 
     def _import_text_from_file(self):
         """Import study items from a text file using the TextParser"""
@@ -753,11 +912,23 @@ class PDFStudyTypingTrainer:
         if not file_path:
             return
         
+        # Read and parse the file in the background so large files don't block Tk
+        future = self._io_pool.submit(self._parse_text_file, file_path)
+        self.root.after(50, self._poll_text_import, future, file_path)
+    
+    @staticmethod
+    def _parse_text_file(file_path):
+        """Read a text file and extract its study items (runs on a worker thread)"""
+        return TextParser.from_file(file_path).parse().get_study_items()
+    
+    def _poll_text_import(self, future, file_path):
+        """Add the parsed text file items on the Tk thread once parsing finishes"""
+        if not future.done():
+            self.root.after(50, self._poll_text_import, future, file_path)
+            return
+        
         try:
-            # Use TextParser to extract study items
-            parser = TextParser.from_file(file_path)
-            parser.parse()
-            items = parser.get_study_items()
+            items = future.result()
             
             if not items:
                 messagebox.showinfo("No Items Found", 
@@ -765,28 +936,11 @@ class PDFStudyTypingTrainer:
                                 "Try using a different file or format.")
                 return
             
-            # Add items to study collection
-            for item in items:
-                self.study_items.append(item)
-                
-                if not hasattr(self, 'study_collection') or self.study_collection is None:
-                    self.study_collection = StudyItemCollection()
-                self.study_collection.add_item(item)
-            
-            # Update learning tracker and challenge generator
-            if not hasattr(self, 'learning_tracker') or self.learning_tracker is None:
-                self.learning_tracker = LearningTracker()
-            self.learning_tracker.load_study_items(items)
-            
-            if not hasattr(self, 'challenge_generator') or self.challenge_generator is None:
-                self.challenge_generator = ChallengeGenerator(self.study_items)
-            else:
-                self.challenge_generator.add_items(items)
+            # Add items to the study list, collection and tracker
+            self._add_study_items(items)
             
             # Update UI
-            self.pdf_name_var.set(f"Loaded text: {os.path.basename(file_path)}")
-            self.items_count_var.set(f"Study items: {len(self.study_items)}")
-            self.extraction_date_var.set(f"Loaded on: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+            self._update_source_labels(f"Loaded text: {os.path.basename(file_path)}", "Loaded on")
             
             # Update item count in text input tab
             self.item_count_var.set(f"Current items: {len(self.study_items)}")
@@ -795,10 +949,10 @@ class PDFStudyTypingTrainer:
             self.study_btn.config(state=tk.NORMAL)
             
             # Show success message
-            messagebox.showinfo("Text Imported", f"Successfully imported {len(items)} study items from the text file!")
+            self._show_input_status(f"Successfully imported {len(items)} study items from the text file!")
             
             # Update statistics
-            self._update_statistics()
+            self._schedule_stats_refresh()
         
         except Exception as e:
             messagebox.showerror("Error", f"Failed to import text file: {str(e)}")
@@ -813,26 +967,16 @@ class PDFStudyTypingTrainer:
                 return
             
             # Insert clipboard content into bulk text
-            self.bulk_text.delete("1.0", tk.END)
-            self.bulk_text.insert("1.0", clipboard_text)
+            self._ensure_input_tab(str(self.bulk_text_tab))
+            _replace_text(self.bulk_text, clipboard_text)
             
             # Switch to bulk text tab
-            for i in range(self.notebook.index("end")):
-                if "Add Text" in self.notebook.tab(i, "text"):
-                    self.notebook.select(i)
-                    break
+            self.notebook.select(self.text_input_tab)
             
             # Focus on the bulk text tab
-            for child in self.text_input_tab.winfo_children():
-                if isinstance(child, ttk.Notebook):
-                    for i in range(child.index("end")):
-                        if "Bulk Text" in child.tab(i, "text"):
-                            child.select(i)
-                            break
+            self.input_notebook.select(self.bulk_text_tab)
             
-            messagebox.showinfo("Clipboard Content", 
-                            "Clipboard content has been inserted into the bulk text area.\n"
-                            "Click 'Import Items' to process and add the content.")
+            self._show_input_status("Clipboard content inserted. Click 'Import Items' to add it.")
         
         except Exception as e:
             messagebox.showerror("Clipboard Error", f"Failed to get clipboard content: {str(e)}")
@@ -856,12 +1000,9 @@ class PDFStudyTypingTrainer:
         
         try:
             # Save study collection
-            if not hasattr(self, 'study_collection') or self.study_collection is None:
-                self.study_collection = StudyItemCollection()
-                self.study_collection.add_items(self.study_items)
-            
             self.study_collection.save_to_file(filename)
-            messagebox.showinfo("Success", f"Saved {len(self.study_items)} study items to {filename}!")
+            self._refresh_saved_files()
+            self._show_input_status(f"Saved {len(self.study_items)} study items to {os.path.basename(filename)}!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save items: {str(e)}")
     
@@ -883,7 +1024,7 @@ class PDFStudyTypingTrainer:
         progress_window.grab_set()
         
         ttk.Label(progress_window, text="Extracting study items from PDF...",
-                 font=("Arial", 12)).pack(pady=10)
+                 style="Title.TLabel").pack(pady=10)
         
         progress_bar = ttk.Progressbar(progress_window, mode="indeterminate")
         progress_bar.pack(fill=tk.X, padx=20, pady=10)
@@ -892,65 +1033,102 @@ class PDFStudyTypingTrainer:
         status_var = tk.StringVar(value="Initializing...")
         ttk.Label(progress_window, textvariable=status_var).pack(pady=10)
         
-        # Extract in a separate thread to avoid freezing the UI
-        def extract_from_pdf():
+        # Extract on the I/O pool; the worker only reports through the queue
+        # and all widget updates happen in _poll_pdf_queue on the Tk thread
+        status_queue = queue.Queue()
+        self._io_pool.submit(self._extract_pdf_items, file_path, status_queue)
+        self.root.after(100, self._poll_pdf_queue, status_queue, file_path, status_var, progress_window)
+    
+    def _extract_pdf_items(self, file_path, status_queue):
+        """Extract and save study items from a PDF (runs on a worker thread)"""
+        try:
+            status_queue.put(("status", "Reading PDF..."))
+            
+            # Extract study items
+            from parser.content_parser import PDFStudyExtractor
+            extractor = PDFStudyExtractor(file_path)
+            
+            # Report progress every few pages as the PDF is read
+            def on_page(pages_read):
+                if pages_read % PDF_PROGRESS_PAGES == 0:
+                    status_queue.put(("status", f"Reading PDF... {pages_read} pages"))
+            extractor.extract(on_page=on_page)
+            
+            status_queue.put(("status", "Processing content..."))
+            extractor.process()
+            
+            collection = StudyItemCollection()
+            collection.add_items(extractor.get_study_items())
+            
+            # Save the extracted items; they are studied even if saving fails
+            filename = os.path.splitext(os.path.basename(file_path))[0]
+            save_path = os.path.join(self.data_dir, f"{filename}_study_items.json")
             try:
-                # Update status
-                status_var.set("Reading PDF...")
-                self.root.update_idletasks()
-                
-                # Extract study items
-                extractor = PDFStudyExtractor(file_path)
-                
-                status_var.set("Processing content...")
-                self.root.update_idletasks()
-                
-                extractor.process()
-                self.study_items = extractor.get_study_items()
-                
-                # Update UI with extracted info
-                self.pdf_name_var.set(f"PDF: {os.path.basename(file_path)}")
-                self.items_count_var.set(f"Study items: {len(self.study_items)}")
-                self.extraction_date_var.set(f"Last extracted: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-                
-                # Update study collection
-                self.study_collection = StudyItemCollection()
-                self.study_collection.add_items(self.study_items)
-                
-                # Update learning tracker and challenge generator
-                self.learning_tracker = LearningTracker()
-                self.learning_tracker.load_study_items(self.study_items)
-                self.challenge_generator = ChallengeGenerator(self.study_items)
-                
-                # Enable study button if we have items
-                if self.study_items:
-                    self.study_btn.config(state=tk.NORMAL)
-                
-                # Update statistics
-                self._update_statistics()
-                
-                # Save the extracted items
-                filename = os.path.splitext(os.path.basename(file_path))[0]
-                save_path = os.path.join(self.data_dir, f"{filename}_study_items.json")
-                self.study_collection.save_to_file(save_path)
-                
-                status_var.set(f"Extracted {len(self.study_items)} study items!")
+                collection.save_to_file(save_path, cache=True)
             except Exception as e:
-                status_var.set(f"Error: {str(e)}")
-            finally:
-                # Close progress window after a delay
-                self.root.after(1500, progress_window.destroy)
+                print(f"Error saving extracted items: {str(e)}")
+            
+            status_queue.put(("done", collection))
+        except Exception as e:
+            status_queue.put(("error", e))
+    
+    def _poll_pdf_queue(self, status_queue, file_path, status_var, progress_window):
+        """Apply PDF extraction progress and results on the Tk thread"""
+        while True:
+            try:
+                kind, payload = status_queue.get_nowait()
+            except queue.Empty:
+                # Worker still running, check again shortly
+                self.root.after(100, self._poll_pdf_queue, status_queue, file_path, status_var, progress_window)
+                return
+            
+            if kind == "status":
+                status_var.set(payload)
+            elif kind == "error":
+                status_var.set(f"Error: {str(payload)}")
+                break
+            else:
+                self._apply_pdf_collection(payload, file_path)
+                self._refresh_saved_files()
+                status_var.set(f"Extracted {len(self.study_items)} study items!")
+                break
         
-        # Start extraction thread
-        threading.Thread(target=extract_from_pdf).start()
+        # Close progress window after a delay
+        self.root.after(1500, progress_window.destroy)
+    
+    def _apply_pdf_collection(self, collection, file_path):
+        """Make a freshly extracted PDF collection the current study set"""
+        self.study_collection = collection
+        self.study_items = collection.items
+        
+        # Update UI with extracted info
+        self._update_source_labels(f"PDF: {os.path.basename(file_path)}", "Last extracted")
+        
+        # Update learning tracker
+        self.learning_tracker.reset(self.study_items)
+        
+        # Enable study button if we have items
+        if self.study_items:
+            self.study_btn.config(state=tk.NORMAL)
+        
+        # Update statistics
+        self._schedule_stats_refresh()
+    
+    def _refresh_saved_files(self):
+        """Start listing the saved study files on the I/O pool"""
+        self._saved_files_future = self._io_pool.submit(self._list_saved_files)
+    
+    def _list_saved_files(self):
+        """List saved study item files in the data directory (runs on a worker thread)"""
+        return [f for f in os.listdir(self.data_dir) 
+                if f.endswith("_study_items.json")]
     
     def _load_saved_progress(self):
         """Load saved progress from a file"""
-        files = [f for f in os.listdir(self.data_dir) 
-                if f.endswith("_study_items.json")]
+        files = self._saved_files_future.result()
         
         if not files:
-            messagebox.showinfo("No Saved Files", "No saved study files found.")
+            self.design_system.create_toast_notification("No saved study files found.")
             return
         
         # Create a dialog to select a file
@@ -961,7 +1139,7 @@ class PDFStudyTypingTrainer:
         dialog.grab_set()
         
         ttk.Label(dialog, text="Select a study file to load:",
-                 font=("Arial", 12)).pack(pady=10)
+                 style="Title.TLabel").pack(pady=10)
         
         # Create listbox with scrollbar
         list_frame = ttk.Frame(dialog)
@@ -981,7 +1159,7 @@ class PDFStudyTypingTrainer:
         
         def on_load():
             if not listbox.curselection():
-                messagebox.showinfo("No Selection", "Please select a file to load.")
+                self.design_system.create_toast_notification("Please select a file to load.")
                 return
             
             selected_file = listbox.get(listbox.curselection()[0])
@@ -993,24 +1171,20 @@ class PDFStudyTypingTrainer:
             self.study_collection = collection
             
             # Update UI
-            self.pdf_name_var.set(f"Loaded: {selected_file}")
-            self.items_count_var.set(f"Study items: {len(self.study_items)}")
-            self.extraction_date_var.set(f"Loaded on: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+            self._update_source_labels(f"Loaded: {selected_file}", "Loaded on")
             
-            # Update learning tracker and challenge generator
-            self.learning_tracker = LearningTracker()
-            self.learning_tracker.load_study_items(self.study_items)
-            self.challenge_generator = ChallengeGenerator(self.study_items)
+            # Update learning tracker
+            self.learning_tracker.reset(self.study_items)
             
             # Enable study button if we have items
             if self.study_items:
                 self.study_btn.config(state=tk.NORMAL)
             
             # Update statistics
-            self._update_statistics()
+            self._schedule_stats_refresh()
             
             dialog.destroy()
-            messagebox.showinfo("Success", f"Loaded {len(self.study_items)} study items!")
+            self.design_system.create_toast_notification(f"Loaded {len(self.study_items)} study items!")
         
         # Button frame
         button_frame = ttk.Frame(dialog)
@@ -1022,7 +1196,7 @@ class PDFStudyTypingTrainer:
     def _export_taipo_format(self):
         """Export study items to Taipo format"""
         if not self.study_items:
-            messagebox.showinfo("No Study Items", "No study items to export.")
+            self.design_system.create_toast_notification("No study items to export.")
             return
         
         # Get filename
@@ -1040,14 +1214,14 @@ class PDFStudyTypingTrainer:
             # Export to Taipo format
             self.study_formatter.save_taipo_format(self.study_items, 
                                                   os.path.splitext(os.path.basename(filename))[0])
-            messagebox.showinfo("Success", f"Exported study items to Taipo format!")
+            self.design_system.create_toast_notification("Exported study items to Taipo format!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export: {str(e)}")
     
     def _export_word_list(self):
         """Export study items as a word list"""
         if not self.study_items:
-            messagebox.showinfo("No Study Items", "No study items to export.")
+            self.design_system.create_toast_notification("No study items to export.")
             return
         
         # Get filename
@@ -1065,7 +1239,7 @@ class PDFStudyTypingTrainer:
             # Export as word list
             self.study_formatter.convert_to_word_list(self.study_items, 
                                                     os.path.splitext(os.path.basename(filename))[0])
-            messagebox.showinfo("Success", f"Exported study items as word list!")
+            self.design_system.create_toast_notification("Exported study items as word list!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export: {str(e)}")
     
@@ -1091,11 +1265,10 @@ class PDFStudyTypingTrainer:
             stats["total_study_items"] = len(self.study_items)
             
             # Save to file
-            with open(filename, "w") as f:
-                import json
-                json.dump(stats, f, indent=2)
+            with open(filename, "wb") as f:
+                f.write(json_dumps(stats))
             
-            messagebox.showinfo("Success", f"Exported learning statistics!")
+            self.design_system.create_toast_notification("Exported learning statistics!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export: {str(e)}")
     
@@ -1108,11 +1281,12 @@ class PDFStudyTypingTrainer:
         # Initialize the learning tracker
         self.learning_tracker.start_session()
         
+        # Switch to study tab first so it is drawn once with the first item
+        self._ensure_study_tab()
+        self.notebook.select(self.study_tab)
+        
         # Load the first item
         self._load_next_item()
-        
-        # Switch to study tab
-        self.notebook.select(1)
     
     def _load_next_item(self):
         """Load the next study item"""
@@ -1125,9 +1299,12 @@ class PDFStudyTypingTrainer:
             return
         
         # Generate a challenge
-        self.current_challenge = self.challenge_generator.challenge_generator = TypingChallenge(study_item)
+        self.current_challenge = TypingChallenge(study_item)
         self.current_challenge.start()
         
+        # Only the leading characters of the answer are shown as feedback
+        self._expected_prefix = study_item.answer[:FEEDBACK_CHARS]
+        
         # Update UI
         self.context_var.set(f"Context: {study_item.context} • Type: {study_item.item_type.value}")
         self.prompt_var.set(study_item.prompt)
@@ -1153,31 +1330,42 @@ class PDFStudyTypingTrainer:
         # Focus on typing area
         self.typing_text.focus_set()
     
+    def _schedule_typing_feedback(self, event=None):
+        """Coalesce key releases into at most one feedback redraw per frame"""
+        if self._feedback_after_id is None:
+            self._feedback_after_id = self.root.after(FEEDBACK_DELAY_MS, self._do_typing_feedback)
+    
+    def _do_typing_feedback(self):
+        """Run a pending typing feedback redraw"""
+        self._feedback_after_id = None
+        self._update_typing_feedback(None)
+    
+    def _typed_feedback_prefix(self):
+        """Return the first FEEDBACK_CHARS of the stripped typed text without reading the whole widget"""
+        text = self.typing_text
+        start = text.search(r"\S", "1.0", stopindex=tk.END, regexp=True)
+        if not start:
+            return ""
+        
+        window_end = f"{start} + {FEEDBACK_CHARS} chars"
+        window = text.get(start, window_end)
+        
+        # Whitespace at the edge of a full window is only kept if more text follows it
+        if (len(window) == FEEDBACK_CHARS and window[-1].isspace()
+                and text.search(r"\S", window_end, stopindex=tk.END, regexp=True)):
+            return window
+        return window.rstrip()
+    
     def _update_typing_feedback(self, event):
         """Update real-time feedback for typing"""
         if not self.current_challenge:
             return
         
         # Get typed text and expected text
-        typed = self.typing_text.get(1.0, tk.END).strip()
-        expected = self.current_challenge.study_item.answer
+        typed = self._typed_feedback_prefix()
+        expected = self._expected_prefix
         
-        # Clear canvas
-        self.feedback_canvas.delete("all")
-        
-        # Draw feedback
-        for i, (typed_char, expected_char) in enumerate(zip(typed, expected)):
-            if i >= 50:  # Only show first 50 characters
-                break
-                
-            if typed_char == expected_char:
-                color = "green"
-            else:
-                color = "red"
-            
-            self.feedback_canvas.create_rectangle(
-                i * 10, 0, (i + 1) * 10, 20, fill=color, outline=""
-            )
+        self.feedback_strip.update(typed, expected)
     
     def _submit_answer(self):
         """Submit the answer for the current challenge"""
@@ -1208,12 +1396,12 @@ class PDFStudyTypingTrainer:
     
     def _end_study_session(self):
         """End the current study session"""
-        if hasattr(self.learning_tracker, 'session_stats') and self.learning_tracker.session_stats["start_time"]:
+        if self.learning_tracker.session_stats["start_time"]:
             # Get session summary
             summary = self.learning_tracker.end_session()
             
             # Add to sessions table
-            self.sessions_table.insert("", 0, values=(
+            self._add_session_row((
                 summary["date"],
                 f"{summary['duration_minutes']:.1f} min",
                 summary["items_studied"],
@@ -1225,7 +1413,7 @@ class PDFStudyTypingTrainer:
             self.learning_tracker.save_progress()
             
             # Update statistics
-            self._update_statistics()
+            self._schedule_stats_refresh()
             
             # Show summary
             messagebox.showinfo("Session Summary", 
@@ -1236,22 +1424,63 @@ class PDFStudyTypingTrainer:
                                f"Duration: {summary['duration_minutes']:.1f} minutes")
         
         # Switch back to dashboard
-        self.notebook.select(0)
+        self.notebook.select(self.dashboard_tab)
+    
+    def _add_session_row(self, values):
+        """Prepend a session to the sessions table, keeping only the most recent ones"""
+        # Without the notebook there is no statistics tab to record into
+        if self.notebook is None:
+            return
+        
+        self._ensure_stats_tab()
+        self.sessions_table.insert("", 0, values=values)
+        
+        # Evict the oldest row so the table stays bounded
+        children = self.sessions_table.get_children()
+        if len(children) > MAX_VISIBLE_SESSIONS:
+            self.sessions_table.delete(children[-1])
+    
+    def _schedule_stats_refresh(self):
+        """Mark statistics dirty and refresh them once the event loop is idle"""
+        # The statistics widgets live in the notebook's tabs
+        if self.notebook is None:
+            return
+        
+        self._stats_dirty = True
+        
+        if not self._stats_pending:
+            self._stats_pending = True
+            self.root.after_idle(self._do_stats_refresh)
+    
+    def _do_stats_refresh(self):
+        """Run a pending statistics refresh"""
+        self._stats_pending = False
+        
+        if self._stats_dirty:
+            self._stats_dirty = False
+            self._update_statistics()
     
     def _update_statistics(self):
         """Update all statistics displays"""
         # Update due items count
         due_count = self.learning_tracker.get_due_items_count()
-        self.due_items_var.set(f"Items due for review: {due_count}")
+        _set_if_changed(self.due_items_var, f"Items due for review: {due_count}")
         
         # Update overall mastery
         stats = self.learning_tracker.get_learning_stats()
-        self.mastery_var.set(f"Overall mastery: {stats['average_mastery']*100:.1f}%")
+        _set_if_changed(self.mastery_var, f"Overall mastery: {stats['average_mastery']*100:.1f}%")
+        
+        # The stats tab is only redrawn while it is showing; it catches up
+        # when it is built or shown
+        if not self._stats_built or not self.stats_tab.winfo_ismapped():
+            self._stats_tab_stale = True
+            return
+        self._stats_tab_stale = False
         
         # Update stats tab
-        self.total_items_var.set(f"Total Items: {stats['total_items']}")
-        self.mastered_items_var.set(f"Mastered Items: {stats['mastered_items']} ({stats['mastery_percentage']:.1f}%)")
-        self.avg_mastery_var.set(f"Average Mastery: {stats['average_mastery']*100:.1f}%")
+        _set_if_changed(self.total_items_var, f"Total Items: {stats['total_items']}")
+        _set_if_changed(self.mastered_items_var, f"Mastered Items: {stats['mastered_items']} ({stats['mastery_percentage']:.1f}%)")
+        _set_if_changed(self.avg_mastery_var, f"Average Mastery: {stats['average_mastery']*100:.1f}%")
 
         # Update category progress visualization
         self._update_category_visualization()
@@ -1261,22 +1490,24 @@ class PDFStudyTypingTrainer:
         if not self.study_items:
             return
         
-        # Clear canvas
-        self.category_canvas.delete("all")
-        
-        # Group items by type
-        categories = {}
+        # Accumulate mastery sums and counts per category index in one pass.
+        # Enum .value is a property, so resolve each item type's index once.
+        mastery_sums = [0.0] * len(_CATEGORY_NAMES)
+        item_counts = [0] * len(_CATEGORY_NAMES)
+        type_index = {}
         for item in self.study_items:
-            category = item.item_type.value
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(item)
-        
-        # Calculate average mastery for each category
-        mastery_by_category = {}
-        for category, items in categories.items():
-            avg_mastery = sum(item.mastery for item in items) / len(items)
-            mastery_by_category[category] = avg_mastery
+            item_type = item.item_type
+            cat_idx = type_index.get(item_type)
+            if cat_idx is None:
+                cat_idx = type_index[item_type] = _CATEGORY_INDEX[item_type.value]
+            mastery_sums[cat_idx] += item.mastery
+            item_counts[cat_idx] += 1
+        
+        # Calculate average mastery for each category that has items
+        mastery_by_category = {
+            cat_idx: mastery_sums[cat_idx] / count
+            for cat_idx, count in enumerate(item_counts) if count
+        }
         
         # Draw bars
         canvas_width = self.category_canvas.winfo_width()
@@ -1289,77 +1520,91 @@ class PDFStudyTypingTrainer:
         bar_width = canvas_width / (len(mastery_by_category) + 1)
         max_bar_height = canvas_height - 40  # Leave space for labels
         
-        # Colors for different categories
-        colors = {
-            "definition": "#4287f5",  # Blue
-            "key_concept": "#42f551",  # Green
-            "formula": "#f54242",  # Red
-            "list": "#f5a742",  # Orange
-            "fill_in_blank": "#b042f5"  # Purple
-        }
+        # Look up fixed coordinates once for the whole loop
+        canvas = self.category_canvas
+        bar_bottom = canvas_height - 30
+        label_y = canvas_height - 15
         
-        # Draw bars
+        # Slot x positions only change with the canvas size or bar count
+        layout = (canvas_width, canvas_height, len(mastery_by_category))
+        layout_changed = layout != self._chart_layout
+        self._chart_layout = layout
+        
+        # Bind each category to the next pool slot and move its items into place
         x_offset = bar_width / 2
-        for category, mastery in mastery_by_category.items():
-            bar_height = mastery * max_bar_height
+        for slot, (cat_idx, mastery) in enumerate(mastery_by_category.items()):
+            bar_id, label_id, pct_id = self._bar_pool[slot]
+            bar_top = bar_bottom - mastery * max_bar_height
+            text_x = x_offset + bar_width / 2 - 5
+            percentage = round(mastery * 100)
             
-            # Bar
-            color = colors.get(category, "#888888")
-            self.category_canvas.create_rectangle(
-                x_offset, canvas_height - 30 - bar_height,
-                x_offset + bar_width - 10, canvas_height - 30,
-                fill=color, outline="black"
-            )
+            # Only issue coords() for items whose position actually changed
+            moved = layout_changed or self._slot_categories[slot] != cat_idx
+            if moved or self._slot_mastery[slot] != mastery:
+                canvas.coords(bar_id, x_offset, bar_top, x_offset + bar_width - 10, bar_bottom)
+                canvas.coords(pct_id, text_x, bar_top - 5)
+                self._slot_mastery[slot] = mastery
+            if moved:
+                canvas.coords(label_id, text_x, label_y)
             
-            # Label
-            self.category_canvas.create_text(
-                x_offset + bar_width / 2 - 5, canvas_height - 15,
-                text=category.replace("_", " ").title(),
-                angle=45, anchor=tk.NE
-            )
+            # Restyle and show the slot when it starts showing another category
+            if self._slot_categories[slot] != cat_idx:
+                canvas.itemconfigure(bar_id, fill=_CATEGORY_COLORS[cat_idx], state=tk.NORMAL)
+                canvas.itemconfigure(label_id, text=_CATEGORY_LABELS[cat_idx], state=tk.NORMAL)
+                canvas.itemconfigure(pct_id, state=tk.NORMAL)
+                self._slot_categories[slot] = cat_idx
             
-            # Percentage
-            self.category_canvas.create_text(
-                x_offset + bar_width / 2 - 5, canvas_height - 30 - bar_height - 5,
-                text=f"{mastery*100:.0f}%",
-                anchor=tk.S
-            )
+            # Only reformat the percentage text when the shown value changes
+            if self._slot_percentages[slot] != percentage:
+                canvas.itemconfigure(pct_id, text=f"{percentage}%")
+                self._slot_percentages[slot] = percentage
             
             x_offset += bar_width
+        
+        # Hide slots that are not in use
+        for slot in range(len(mastery_by_category), len(self._bar_pool)):
+            if self._slot_categories[slot] is not None:
+                for item_id in self._bar_pool[slot]:
+                    canvas.itemconfigure(item_id, state=tk.HIDDEN)
+                self._slot_categories[slot] = None
     
     def _try_load_progress(self):
         """Try to load previous progress if available"""
-        default_progress_file = os.path.join(self.data_dir, "learning_progress.json")
+        # Read and parse the progress file into a separate tracker state off
+        # the Tk thread; a missing file simply reports no progress
+        future = self._io_pool.submit(LearningTracker.read_progress)
+        self.root.after(50, self._poll_progress_load, future)
+    
+    def _poll_progress_load(self, future):
+        """Apply previous progress on the Tk thread once the background load finishes"""
+        if not future.done():
+            self.root.after(50, self._poll_progress_load, future)
+            return
         
-        if os.path.exists(default_progress_file):
-            try:
-                # Load progress
-                success = self.learning_tracker.load_progress()
+        try:
+            system = future.result()
+            
+            if system is not None:
+                # Loaded items go ahead of any added while the file was read.
+                # A new list is bound rather than inserting in place, since
+                # the old one may be a practice session's item list
+                loaded_items = list(system.study_items)
+                self.learning_tracker.adopt_progress(system)
+                self.study_items = loaded_items + self.study_items
+                self.study_collection = StudyItemCollection(self.study_items)
                 
-                if success:
-                    # Get items from learning tracker
-                    self.study_items = self.learning_tracker.spaced_repetition.study_items
-                    
-                    # Update study collection
-                    self.study_collection = StudyItemCollection()
-                    self.study_collection.add_items(self.study_items)
-                    
-                    # Update challenge generator
-                    self.challenge_generator = ChallengeGenerator(self.study_items)
-                    
-                    # Update UI
-                    self.pdf_name_var.set(f"Loaded from previous session")
-                    self.items_count_var.set(f"Study items: {len(self.study_items)}")
-                    self.extraction_date_var.set(f"Loaded on: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+                # Update UI (the dashboard lives in the notebook)
+                if self.notebook is not None:
+                    self._update_source_labels("Loaded from previous session", "Loaded on")
                     
                     # Enable study button if we have items
                     if self.study_items:
                         self.study_btn.config(state=tk.NORMAL)
-                    
-                    # Update statistics
-                    self._update_statistics()
-            except Exception as e:
-                print(f"Error loading previous progress: {str(e)}")
+                
+                # Update statistics
+                self._schedule_stats_refresh()
+        except Exception as e:
+            print(f"Error loading previous progress: {str(e)}")
 
     def _parse_text_input(self, text):
         """Parse various text input formats to create study items
@@ -1371,69 +1616,72 @@ class PDFStudyTypingTrainer:
         """
         items = []
         
-        # Check if it's Q&A format
-        if "Q:" in text and "A:" in text:
-            # Split by Q: to get individual QA pairs
-            qa_pairs = text.split("Q:")
-            for pair in qa_pairs:
-                if not pair.strip():
+        # Look these up once rather than for every item
+        item_type = StudyItemType.KEY_CONCEPT
+        importance = self.importance_var.get()
+        
+        # Check if it's Q&A format; Q&A input starts with "Q:", so only the
+        # start of the text is looked at before committing to it
+        if text[:512].lstrip().startswith("Q:") and "A:" in text:
+            # Single left-to-right scan: a question runs up to its first
+            # "A:", an answer up to the next "Q:"
+            q = text.find("Q:")
+            while q >= 0:
+                a = text.find("A:", q + 2)
+                if a < 0:
+                    break
+                nxt = text.find("Q:", q + 2)
+                if 0 <= nxt < a:
+                    # Question without an answer
+                    q = nxt
                     continue
-                    
-                # Find answer part
-                if "A:" in pair:
-                    question_part, answer_part = pair.split("A:", 1)
-                    prompt = f"Q: {question_part.strip()}"
-                    answer = answer_part.strip()
-                    
-                    item = StudyItem(
-                        id=str(uuid.uuid4()),
-                        prompt=prompt,
-                        answer=answer,
-                        context="Q&A",
-                        item_type=StudyItemType.KEY_CONCEPT,
-                        importance=self.importance_var.get(),
-                        mastery=0.0,
-                        source_document="Text Input"
-                    )
-                    items.append(item)
+                nxt = text.find("Q:", a + 2)
+                end = nxt if nxt >= 0 else len(text)
+                items.append(StudyItem(
+                    id=new_item_id(),
+                    prompt=f"Q: {text[q + 2:a].strip()}",
+                    answer=text[a + 2:end].strip(),
+                    context="Q&A",
+                    item_type=item_type,
+                    importance=importance,
+                    mastery=0.0,
+                    source_document="Text Input"
+                ))
+                q = nxt
         else:
-            # Process as simple lines or pipe-delimited
-            lines = text.strip().split('\n')
-            for line in lines:
-                if not line.strip():
-                    continue
-                    
-                if '|' in line:
-                    # Pipe-delimited format
-                    parts = line.split('|')
-                    if len(parts) >= 3:
-                        prompt, answer, context = parts[0], parts[1], parts[2]
-                    elif len(parts) == 2:
-                        prompt, answer = parts[0], parts[1]
-                        context = "Custom Content"
-                    else:
-                        prompt = "Type this:"
-                        answer = line
-                        context = "Custom Content"
-                else:
-                    # Simple line format
-                    prompt = "Type this:"
-                    answer = line
-                    context = "Custom Content"
-                    
-                item = StudyItem(
-                    id=str(uuid.uuid4()),
+            # Process as simple lines or pipe-delimited, building the
+            # items in one comprehension; lines are matched one at a time
+            # rather than split into a list up front
+            fields = (self._split_input_line(match.group())
+                      for match in _INPUT_LINE_RE.finditer(text))
+            items = [
+                StudyItem(
+                    id=new_item_id(),
                     prompt=prompt,
                     answer=answer,
                     context=context,
-                    item_type=StudyItemType.KEY_CONCEPT,
-                    importance=self.importance_var.get(),
+                    item_type=item_type,
+                    importance=importance,
                     mastery=0.0,
                     source_document="Text Input"
                 )
-                items.append(item)
+                for prompt, answer, context in fields
+            ]
         
         return items
+    
+    @staticmethod
+    def _split_input_line(line):
+        """Split a quick-add line into (prompt, answer, context)"""
+        # Pipe-delimited format has up to three fields; anything past the
+        # third is dropped
+        parts = line.split('|', 3)
+        if len(parts) >= 3:
+            return parts[0], parts[1], parts[2]
+        if len(parts) == 2:
+            return parts[0], parts[1], "Custom Content"
+        # Simple line format
+        return "Type this:", line, "Custom Content"
 
 
 def main():
@@ -1441,14 +1689,11 @@ def main():
     root = tk.Tk()
     root.title("PDF Study Typing Trainer")
     
-    # Set theme - use 'clam' theme for better aesthetics
+    # Set theme - derive from 'clam' for better aesthetics, with fonts
+    # configured in a single theme definition
     style = ttk.Style()
-    style.theme_use('clam')
-    
-    # Configure colors
-    style.configure('TLabel', font=('Arial', 10))
-    style.configure('TButton', font=('Arial', 10))
-    style.configure('TLabelframe.Label', font=('Arial', 10, 'bold'))
+    style.theme_create('app', parent='clam', settings=APP_THEME_SETTINGS)
+    style.theme_use('app')
     
     # Create the application
     app = PDFStudyTypingTrainer(root)
@@ -2,44 +2,30 @@
 
 import fitz  # PyMuPDF
 import re
-import uuid
-from typing import List, Dict, Any
-from dataclasses import dataclass
-from enum import Enum
+from typing import List, Dict, Any, Iterator, Callable, Optional
 import os
 
+# Extracted items are the app's own StudyItem, so they can be saved and studied directly
+from .study_item import StudyItem, StudyItemType, new_item_id
 
-class StudyItemType(Enum):
-    DEFINITION = "definition"
-    KEY_CONCEPT = "key_concept"
-    FILL_IN_BLANK = "fill_in_blank"
-    FORMULA = "formula"
-    LIST = "list"
 
-
-@dataclass
-class StudyItem:
-    id: str
-    prompt: str  # What the user will type
-    answer: str  # The expected answer
-    context: str  # Section or chapter info
-    item_type: StudyItemType
-    importance: int  # 1-10 importance score
-    mastery: float = 0.0  # 0.0 to 1.0
+# Sentence splitter used by the key concept pass
+_SENTENCE_SPLIT_RE = re.compile(r'\.')
 
 
 class PDFStudyExtractor:
     def __init__(self, pdf_path: str):
         self.pdf_path = pdf_path
         self.raw_text = ""
+        self._extracted = False
         self.study_items: List[StudyItem] = []
         # Area picker, adjust as needed for academic content
         self.scan_area = fitz.Rect(0, 0, 600, 850)
         
-    def extract(self) -> 'PDFStudyExtractor':
-        """Extract text from PDF"""
+    def extract_pages(self) -> Iterator[str]:
+        """Yield the text of each PDF page, one page at a time"""
         if not os.path.exists(self.pdf_path):
-            return self
+            return
             
         with fitz.open(self.pdf_path) as doc:
             # Extract metadata for context
@@ -48,14 +34,23 @@ class PDFStudyExtractor:
             # Extract text from each page
             for page in doc:
                 # Get text within scan area
-                page_text = page.get_text("text", clip=self.scan_area)
-                self.raw_text += page_text
-                
+                yield page.get_text("text", clip=self.scan_area)
+    
+    def extract(self, on_page: Optional[Callable[[int], None]] = None) -> 'PDFStudyExtractor':
+        """Extract text from PDF, calling on_page with the number of pages read so far"""
+        pages = []
+        for page_text in self.extract_pages():
+            pages.append(page_text)
+            if on_page is not None:
+                on_page(len(pages))
+        self.raw_text = "".join(pages)
+        self._extracted = True
         return self
     
     def process(self) -> 'PDFStudyExtractor':
         """Process the extracted text to identify study items"""
-        if not self.raw_text:
+        # A PDF without text is still only read once
+        if not self._extracted:
             self.extract()
             
         # Extract different types of study content
@@ -83,7 +78,7 @@ class PDFStudyExtractor:
                 
                 # Create study items for both term->definition and definition->term
                 self.study_items.append(StudyItem(
-                    id=str(uuid.uuid4()),
+                    id=new_item_id(),
                     prompt=f"Define the term: {term}",
                     answer=definition,
                     context="Terminology",
@@ -92,7 +87,7 @@ class PDFStudyExtractor:
                 ))
                 
                 self.study_items.append(StudyItem(
-                    id=str(uuid.uuid4()),
+                    id=new_item_id(),
                     prompt=f"What term is defined as: {definition}",
                     answer=term,
                     context="Terminology",
@@ -104,22 +99,24 @@ class PDFStudyExtractor:
         """Extract key concepts based on formatting hints or repetition"""
         # Look for sentences with key indicator phrases
         key_phrases = ["important", "key concept", "remember", "critical", "note that"]
-        sentences = re.split(r'\.', self.raw_text)
+        sentences = _SENTENCE_SPLIT_RE.split(self.raw_text)
+        seen = set()
         
         for sentence in sentences:
-            for phrase in key_phrases:
-                if phrase in sentence.lower():
-                    # Found a potential key concept
-                    concept = sentence.strip()
-                    if len(concept) > 20:  # Ensure it's meaningful
-                        self.study_items.append(StudyItem(
-                            id=str(uuid.uuid4()),
-                            prompt="Type this key concept:",
-                            answer=concept,
-                            context="Key Concepts",
-                            item_type=StudyItemType.KEY_CONCEPT,
-                            importance=8
-                        ))
+            lowered = sentence.lower()
+            if any(phrase in lowered for phrase in key_phrases):
+                # Found a potential key concept; add each distinct one once
+                concept = sentence.strip()
+                if len(concept) > 20 and concept not in seen:  # Ensure it's meaningful
+                    seen.add(concept)
+                    self.study_items.append(StudyItem(
+                        id=new_item_id(),
+                        prompt="Type this key concept:",
+                        answer=concept,
+                        context="Key Concepts",
+                        item_type=StudyItemType.KEY_CONCEPT,
+                        importance=8
+                    ))
     
     def _extract_formulas(self):
         """Extract mathematical or scientific formulas"""
@@ -130,7 +127,7 @@ class PDFStudyExtractor:
         for variable, formula in matches:
             formula_text = f"{variable} = {formula}"
             self.study_items.append(StudyItem(
-                id=str(uuid.uuid4()),
+                id=new_item_id(),
                 prompt=f"Type the formula for {variable}:",
                 answer=formula_text,
                 context="Formulas",
@@ -148,7 +145,7 @@ class PDFStudyExtractor:
             list_text = match[0].strip()
             if len(list_text) > 30:  # Ensure it's a meaningful list
                 self.study_items.append(StudyItem(
-                    id=str(uuid.uuid4()),
+                    id=new_item_id(),
                     prompt="Type out this list in order:",
                     answer=list_text,
                     context="Lists",
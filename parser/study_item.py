@@ -1,11 +1,53 @@
 # parser/study_item.py
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-import uuid
+import itertools
+import os
 import json
+import pickle
+
+# orjson is optional; files are plain JSON either way
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(raw: bytes) -> Any:
+    """Parse JSON from a bytes-like object, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    # The stdlib parser takes bytes, not memoryviews
+    return json.loads(bytes(raw))
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# Errors that mean a pickle sidecar is unreadable or stale (truncated,
+# written by an older layout, or naming a moved class), so callers fall
+# back to the JSON file
+SIDECAR_LOAD_ERRORS = (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+                       ValueError, TypeError, ImportError)
+
+
+# Ids are a random per-process prefix plus a counter, so only the prefix
+# needs the OS random source
+_ID_PREFIX = os.urandom(8).hex()
+_id_counter = itertools.count()
+
+
+def new_item_id() -> str:
+    """Generate a unique 32-character hex study item id"""
+    return f"{_ID_PREFIX}{next(_id_counter):016x}"
+
 
 class StudyItemType(Enum):
     DEFINITION = "definition"
@@ -15,19 +57,38 @@ class StudyItemType(Enum):
     LIST = "list"
 
 
-@dataclass
+@dataclass(init=False)
 class StudyItem:
     """Represents a single study item extracted from a document"""
+    # Slotted: large imports and PDFs hold many items, and no per-instance
+    # __dict__ keeps each one small. The slots are written out by hand, and
+    # the defaults live in __init__, so this works before Python 3.10
+    __slots__ = ("id", "prompt", "answer", "context", "item_type",
+                 "importance", "mastery", "last_studied", "source_document")
+    
+    id: str
+    prompt: str  # What the user will see as a prompt
+    answer: str  # The expected answer to type
+    context: str  # Section or chapter info
+    item_type: StudyItemType
+    importance: int  # 1-10 importance score
+    mastery: float  # 0.0 to 1.0 mastery level
+    last_studied: Optional[datetime]
+    source_document: str  # Source document name
     
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    prompt: str = ""  # What the user will see as a prompt
-    answer: str = ""  # The expected answer to type
-    context: str = ""  # Section or chapter info
-    item_type: StudyItemType = StudyItemType.KEY_CONCEPT
-    importance: int = 5  # 1-10 importance score
-    mastery: float = 0.0  # 0.0 to 1.0 mastery level
-    last_studied: Optional[datetime] = None
-    source_document: str = ""  # Source document name
+    def __init__(self, id: Optional[str] = None, prompt: str = "", answer: str = "",
+                 context: str = "", item_type: StudyItemType = StudyItemType.KEY_CONCEPT,
+                 importance: int = 5, mastery: float = 0.0,
+                 last_studied: Optional[datetime] = None, source_document: str = ""):
+        self.id = id if id is not None else new_item_id()
+        self.prompt = prompt
+        self.answer = answer
+        self.context = context
+        self.item_type = item_type
+        self.importance = importance
+        self.mastery = mastery
+        self.last_studied = last_studied
+        self.source_document = source_document
     
     def get_difficulty_score(self) -> float:
         """Calculate how difficult this item is based on length, mastery, etc."""
@@ -64,7 +125,7 @@ class StudyItem:
                 pass
         
         return cls(
-            id=data.get("id", str(uuid.uuid4())),
+            id=data.get("id") or new_item_id(),
             prompt=data.get("prompt", ""),
             answer=data.get("answer", ""),
             context=data.get("context", ""),
@@ -79,8 +140,10 @@ class StudyItem:
 class StudyItemCollection:
     """A collection of study items with save/load capabilities"""
     
-    def __init__(self):
-        self.items: List[StudyItem] = []
+    def __init__(self, items: Optional[List[StudyItem]] = None):
+        # A given list is used as is, not copied, so the caller's list and
+        # the collection stay the same container
+        self.items: List[StudyItem] = items if items is not None else []
     
     def add_item(self, item: StudyItem) -> None:
         """Add a study item to the collection"""
@@ -101,8 +164,12 @@ class StudyItemCollection:
                 return item
         return None
     
-    def save_to_file(self, filepath: str) -> None:
-        """Save study items to a JSON file"""
+    def save_to_file(self, filepath: str, cache: bool = False) -> None:
+        """Save study items to a JSON file
+        
+        With cache=True a pickle sidecar is written next to the JSON file so
+        load_from_file can skip the JSON parse on the next load.
+        """
         data = {
             "items": [item.to_dict() for item in self.items],
             "metadata": {
@@ -111,21 +178,34 @@ class StudyItemCollection:
             }
         }
         
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(json_dumps(data))
+        
+        if cache:
+            with open(filepath + ".pkl", "wb") as f:
+                pickle.dump(self.items, f, protocol=5)
     
     @classmethod
     def load_from_file(cls, filepath: str) -> 'StudyItemCollection':
-        """Load study items from a JSON file"""
+        """Load study items from a JSON file, preferring a fresh pickle sidecar"""
         collection = cls()
         
+        # Use the sidecar only if it is at least as new as the JSON file
+        cache_path = filepath + ".pkl"
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(filepath):
+                with open(cache_path, "rb") as f:
+                    collection.items = pickle.load(f)
+                return collection
+        except SIDECAR_LOAD_ERRORS:
+            pass
+        
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
+            with open(filepath, "rb") as f:
+                data = json_loads(f.read())
             
             items_data = data.get("items", [])
-            for item_data in items_data:
-                collection.add_item(StudyItem.from_dict(item_data))
+            collection.add_items([StudyItem.from_dict(item_data) for item_data in items_data])
                 
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Error loading study items: {str(e)}")
@@ -1,9 +1,19 @@
 # parser/text_parser.py
 
 import re
-import uuid
 from typing import List, Dict, Any, Optional
-from .study_item import StudyItem, StudyItemType
+from .study_item import StudyItem, StudyItemType, new_item_id
+
+# Format detection patterns
+_QUESTION_MARKER_RE = re.compile(r'Q\s*:|Question\s*:', re.IGNORECASE)
+_ANSWER_MARKER_RE = re.compile(r'A\s*:|Answer\s*:', re.IGNORECASE)
+_DEFINITION_LINE_RE = re.compile(r'^[A-Z][a-zA-Z\s]{2,40}[\s]*[-:]\s', re.MULTILINE)
+_BULLET_LINE_RE = re.compile(r'^[\s]*[•\-\*]\s', re.MULTILINE)
+
+# Extraction patterns
+_QA_PAIR_RE = re.compile(r'(?:^|\n)(?:Q\s*:|Question\s*:)(.*?)(?:(?:\n)(?:A\s*:|Answer\s*:)(.*?)(?=(?:\n)(?:Q\s*:|Question\s*:)|$))', re.DOTALL)
+_DEFINITION_RE = re.compile(r'^([A-Z][a-zA-Z\s]{2,40})[\s]*[-:]\s+(.*?)(?=\n[A-Z]|$)', re.MULTILINE | re.DOTALL)
+_BULLET_RE = re.compile(r'^[\s]*[•\-\*]\s+(.*?)(?=\n[\s]*[•\-\*]|$)', re.MULTILINE | re.DOTALL)
 
 class TextParser:
     """Parser for extracting study items from plain text content"""
@@ -37,24 +47,23 @@ class TextParser:
     
     def _looks_like_qa_format(self) -> bool:
         """Check if the text looks like a Q&A format"""
-        return bool(re.search(r'Q\s*:|Question\s*:', self.text, re.IGNORECASE) and 
-                    re.search(r'A\s*:|Answer\s*:', self.text, re.IGNORECASE))
+        return bool(_QUESTION_MARKER_RE.search(self.text) and 
+                    _ANSWER_MARKER_RE.search(self.text))
     
     def _looks_like_definition_list(self) -> bool:
         """Check if the text looks like a definition list"""
         # Look for patterns like "Term - Definition" or "Term: Definition"
-        return bool(re.search(r'^[A-Z][a-zA-Z\s]{2,40}[\s]*[-:]\s', self.text, re.MULTILINE))
+        return bool(_DEFINITION_LINE_RE.search(self.text))
     
     def _looks_like_bullet_list(self) -> bool:
         """Check if the text looks like a bullet list"""
         # Look for bullet patterns like "• item" or "- item" or "* item"
-        return bool(re.search(r'^[\s]*[•\-\*]\s', self.text, re.MULTILINE))
+        return bool(_BULLET_LINE_RE.search(self.text))
     
     def _parse_qa_format(self) -> None:
         """Parse text in Q&A format"""
         # Split by Q: or Question:
-        qa_pattern = re.compile(r'(?:^|\n)(?:Q\s*:|Question\s*:)(.*?)(?:(?:\n)(?:A\s*:|Answer\s*:)(.*?)(?=(?:\n)(?:Q\s*:|Question\s*:)|$))', re.DOTALL)
-        matches = qa_pattern.findall(self.text)
+        matches = _QA_PAIR_RE.findall(self.text)
         
         for question, answer in matches:
             question = question.strip()
@@ -62,7 +71,7 @@ class TextParser:
             
             if question and answer:
                 self.study_items.append(StudyItem(
-                    id=str(uuid.uuid4()),
+                    id=new_item_id(),
                     prompt=f"Q: {question}",
                     answer=answer,
                     context="Q&A",
@@ -73,8 +82,7 @@ class TextParser:
     def _parse_definition_list(self) -> None:
         """Parse text as a list of definitions"""
         # Match both "Term - Definition" and "Term: Definition" patterns
-        definition_pattern = re.compile(r'^([A-Z][a-zA-Z\s]{2,40})[\s]*[-:]\s+(.*?)(?=\n[A-Z]|$)', re.MULTILINE | re.DOTALL)
-        matches = definition_pattern.findall(self.text)
+        matches = _DEFINITION_RE.findall(self.text)
         
         for term, definition in matches:
             term = term.strip()
@@ -83,7 +91,7 @@ class TextParser:
             if term and definition:
                 # Create study item for term->definition
                 self.study_items.append(StudyItem(
-                    id=str(uuid.uuid4()),
+                    id=new_item_id(),
                     prompt=f"Define the term: {term}",
                     answer=definition,
                     context="Terminology",
@@ -93,7 +101,7 @@ class TextParser:
                 
                 # Create study item for definition->term
                 self.study_items.append(StudyItem(
-                    id=str(uuid.uuid4()),
+                    id=new_item_id(),
                     prompt=f"What term is defined as: {definition}",
                     answer=term,
                     context="Terminology",
@@ -104,8 +112,7 @@ class TextParser:
     def _parse_bullet_list(self) -> None:
         """Parse text as a bullet list"""
         # Match bullet points
-        bullet_pattern = re.compile(r'^[\s]*[•\-\*]\s+(.*?)(?=\n[\s]*[•\-\*]|$)', re.MULTILINE | re.DOTALL)
-        matches = bullet_pattern.findall(self.text)
+        matches = _BULLET_RE.findall(self.text)
         
         # First, collect all bullet points
         bullet_points = [match.strip() for match in matches if match.strip()]
@@ -115,7 +122,7 @@ class TextParser:
             list_text = "\n".join([f"• {point}" for point in bullet_points])
             
             self.study_items.append(StudyItem(
-                id=str(uuid.uuid4()),
+                id=new_item_id(),
                 prompt="Type this list in order:",
                 answer=list_text,
                 context="List",
@@ -124,31 +131,27 @@ class TextParser:
             ))
             
             # Also create individual items for each point
-            for point in bullet_points:
-                self.study_items.append(StudyItem(
-                    id=str(uuid.uuid4()),
-                    prompt="Type this item:",
-                    answer=point,
-                    context="List Item",
-                    item_type=StudyItemType.KEY_CONCEPT,
-                    importance=5
-                ))
+            self.study_items.extend(StudyItem(
+                id=new_item_id(),
+                prompt="Type this item:",
+                answer=point,
+                context="List Item",
+                item_type=StudyItemType.KEY_CONCEPT,
+                importance=5
+            ) for point in bullet_points)
     
     def _parse_simple_lines(self) -> None:
         """Parse text as simple lines, each becoming a study item"""
-        lines = self.text.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if line:
-                self.study_items.append(StudyItem(
-                    id=str(uuid.uuid4()),
-                    prompt="Type this:",
-                    answer=line,
-                    context="Custom Content",
-                    item_type=StudyItemType.KEY_CONCEPT,
-                    importance=5
-                ))
+        # Strip lines lazily and build items straight from the non-blank ones
+        lines = (line.strip() for line in self.text.splitlines())
+        self.study_items.extend(StudyItem(
+            id=new_item_id(),
+            prompt="Type this:",
+            answer=line,
+            context="Custom Content",
+            item_type=StudyItemType.KEY_CONCEPT,
+            importance=5
+        ) for line in lines if line)
     
     def get_study_items(self) -> List[StudyItem]:
         """Return the extracted study items"""
@@ -866,7 +866,7 @@ class StudySessionManager:
         self.warmup_input_text.delete("1.0", tk.END)
         
         # Clear feedback
-        self.warmup_feedback.delete("all")
+        self.design.clear_feedback_canvas(self.warmup_feedback)
         
         # Reset metrics
         self.warmup_wpm_var.set("WPM: 0")
@@ -960,7 +960,7 @@ class StudySessionManager:
         self.drill_input_text.delete("1.0", tk.END)
         
         # Clear feedback
-        self.drill_feedback.delete("all")
+        self.design.clear_feedback_canvas(self.drill_feedback)
     
     def _update_drill_feedback(self, event):
         """Update drill feedback on typing"""
@@ -1065,7 +1065,7 @@ class StudySessionManager:
         self.challenge_input.delete("1.0", tk.END)
         
         # Clear feedback
-        self.challenge_feedback.delete("all")
+        self.design.clear_feedback_canvas(self.challenge_feedback)
         
         # Increment counter
         self.challenge_count += 1
@@ -1193,7 +1193,7 @@ class StudySessionManager:
         self.error_input.delete("1.0", tk.END)
         
         # Clear feedback
-        self.error_feedback.delete("all")
+        self.design.clear_feedback_canvas(self.error_feedback)
         
         # Get current correct count
         correct_count = self.error_correct_count.get(error_item.id, 0)
@@ -1444,7 +1444,7 @@ class StudySessionManager:
         self.current_step = 0
         
         # Add to session history if possible
-        if hasattr(self.master_app, 'sessions_table'):
+        if hasattr(self.master_app, '_add_session_row'):
             # Format data for table
             now = datetime.now().strftime("%Y-%m-%d %H:%M")
             duration_str = f"{duration:.1f} min"
@@ -1461,7 +1461,7 @@ class StudySessionManager:
                 avg_wpm_str = f"{avg_wpm:.1f}"
             
             # Insert into table
-            self.master_app.sessions_table.insert("", 0, values=(
+            self.master_app._add_session_row((
                 now, duration_str, items_count, avg_acc_str, avg_wpm_str
             ))
 